@@ -1,28 +1,582 @@
+from __future__ import annotations  # annotations mentioning `np` must not trigger the lazy numpy import
+
+import contextvars
+import functools
+import heapq
+import importlib.util
+import itertools
+import mmap
+import os
 import sys
 import time
-from contextlib import contextmanager
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from enum import Enum
 from pathlib import Path
-from typing import NamedTuple, Self, TypeVar
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Generic, Hashable, Iterable, Iterator, Literal, NamedTuple, Self, Sequence, TypeVar, get_args
+
+
+def lazy_import(name: str) -> ModuleType:
+    """returns a module that only actually gets imported once one of its attributes is used"""
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
 
-import numpy as np
+
+# every day imports this module, so it stays cheap to import: modules that only some helpers need are lazy,
+# and there are no dataclasses here (`dataclasses` pulls in `inspect` and `ast`)
+if TYPE_CHECKING:
+    import concurrent.futures as concurrent_futures
+    import hashlib
+    import numpy as np
+    import threading
+    import tracemalloc
+    import weakref
+else:
+    concurrent_futures = lazy_import("concurrent.futures")  # pulls in logging, and only `run_parts` needs it
+    hashlib = lazy_import("hashlib")
+    np = lazy_import("numpy")
+    threading = lazy_import("threading")
+    tracemalloc = lazy_import("tracemalloc")
+    weakref = lazy_import("weakref")
 
 DATA_DIR = Path(__file__).parent / "data"
 
+_input_override: ContextVar[Path | None] = ContextVar("_input_override", default=None)
+
+
+def input_path(day: int) -> Path:
+    if (override := _input_override.get()) is not None:
+        return override
+    return DATA_DIR / f"day{day:02}.txt"
+
+
+@contextmanager
+def use_input(path: Path) -> Iterator[None]:
+    """within this context, `input_path` (and so every `read_input*` function) gives `path` instead of the puzzle input"""
+    token = _input_override.set(path)
+    try:
+        yield
+    finally:
+        _input_override.reset(token)
+
 
 def read_input(day: int) -> str:
-    with open(DATA_DIR / f"day{day:02}.txt", encoding="utf-8") as f:
+    with open(input_path(day), encoding="utf-8") as f:
+        return f.read()
+
+
+def read_input_bytes(day: int) -> bytes:
+    with open(input_path(day), "rb") as f:
         return f.read()
 
 
 @contextmanager
-def timer():
-    time_start = time.perf_counter()
+def map_input(day: int) -> Iterator[mmap.mmap | bytes]:
+    """
+    memory-maps the input file (read-only), so it can be searched or handed to `np.frombuffer` without copying;
+    any `memoryview` or array made from the mapping must be released before the context exits
+    """
+    with open(input_path(day), "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            yield b""
+            return
+        with mapped:
+            yield mapped
+
+
+def iter_input_lines(day: int) -> Iterator[bytes]:
+    """yields each line of the input, without its line ending"""
+    with map_input(day) as mapped:
+        start = 0
+        while start < len(mapped):
+            end = mapped.find(b"\n", start)
+            if end == -1:
+                end = len(mapped)
+            yield mapped[start:end].rstrip(b"\r")
+            start = end + 1
+
+
+def iter_input_chunks(day: int, *, chunk_size: int = 2 ** 20) -> Iterator[bytes]:
+    """yields the input in chunks of at least `chunk_size` bytes (except the last), each ending on a line break"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    with map_input(day) as mapped:
+        start = 0
+        while start < len(mapped):
+            end = mapped.find(b"\n", start + chunk_size - 1)
+            end = len(mapped) if end == -1 else end + 1
+            yield mapped[start:end]
+            start = end
+
+
+class Answers(NamedTuple):
+    """what each day's `main` returns (as well as printing it); `None` for a part with no computed answer"""
+    part1: Any
+    part2: Any
+
+
+class Span:
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_memory: int | None = None  # bytes above the memory in use at the start; only measured while tracemalloc is tracing
+        self.children: list[Span] = []
+        self._peak_memory_floor = 0
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, wall_seconds={self.wall_seconds:.6f}, children={len(self.children)})"
+
+    def find(self, name: str) -> "Span | None":
+        for child in self.children:
+            if child.name == name:
+                return child
+        return None
+
+
+_current_span: ContextVar[Span | None] = ContextVar("_current_span", default=None)
+
+
+@contextmanager
+def span(name: str) -> Iterator[Span]:
+    """
+    times a named section of code, nested under whichever span is currently open;
+    peak memory is recorded too if tracemalloc is tracing (e.g. run with `python -X tracemalloc`)
+    """
+    parent = _current_span.get()
+    this_span = Span(name)
+    if parent is not None:
+        parent.children.append(this_span)
+    tracing_memory = tracemalloc.is_tracing()
+    if tracing_memory:
+        memory_start, peak_so_far = tracemalloc.get_traced_memory()
+        if parent is not None:  # about to reset the peak, so hand the peak so far up to the parent
+            parent._peak_memory_floor = max(parent._peak_memory_floor, peak_so_far)
+        tracemalloc.reset_peak()
+    token = _current_span.set(this_span)
+    cpu_start = time.process_time()
+    this_span.start = time.perf_counter()
     try:
-        yield
+        yield this_span
+    finally:
+        this_span.wall_seconds = time.perf_counter() - this_span.start
+        this_span.cpu_seconds = time.process_time() - cpu_start
+        _current_span.reset(token)
+        if tracing_memory and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, this_span._peak_memory_floor)
+            this_span.peak_memory = peak - memory_start
+            if parent is not None:
+                parent._peak_memory_floor = max(parent._peak_memory_floor, peak)
+
+
+def _merge_spans_by_name(spans: list[Span]) -> dict[str, list[Span]]:
+    merged: dict[str, list[Span]] = {}
+    for s in spans:
+        merged.setdefault(s.name, []).append(s)
+    return merged
+
+
+def format_span_tree(root: Span) -> list[str]:
+    """one line per span name, with same-named siblings (e.g. spans opened in a loop) added together"""
+    lines = []
+
+    def add_lines(spans: list[Span], depth: int):
+        wall = sum(s.wall_seconds for s in spans)
+        cpu = sum(s.cpu_seconds for s in spans)
+        name = spans[0].name if len(spans) == 1 else f"{spans[0].name} (x{len(spans)})"
+        line = f"{'  ' * depth}{name:<{40 - 2 * depth}} {wall:9.3f}s wall {cpu:9.3f}s cpu"
+        peaks = [s.peak_memory for s in spans if s.peak_memory is not None]
+        if len(peaks) > 0:
+            line += f" {max(peaks) / 2 ** 20:9.2f} MiB peak"
+        lines.append(line)
+        for child_spans in _merge_spans_by_name([child for s in spans for child in s.children]).values():
+            add_lines(child_spans, depth + 1)
+
+    add_lines([root], 0)
+    return lines
+
+
+def write_chrome_trace(root: Span, path: Path):
+    """writes the span tree in Chrome's trace event format (open with chrome://tracing or https://ui.perfetto.dev)"""
+    import json
+    events = []
+
+    def add_events(s: Span):
+        args = {"cpu_ms": s.cpu_seconds * 1e3}
+        if s.peak_memory is not None:
+            args["peak_memory_bytes"] = s.peak_memory
+        events.append({
+            "name": s.name,
+            "ph": "X",
+            "ts": (s.start - root.start) * 1e6,
+            "dur": s.wall_seconds * 1e6,
+            "pid": os.getpid(),
+            "tid": 0,
+            "args": args,
+        })
+        for child in s.children:
+            add_events(child)
+
+    add_events(root)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def write_folded_stacks(root: Span, path: Path):
+    """writes the span tree as folded stacks (for flamegraph.pl or speedscope), weighted by self-time in microseconds"""
+    self_times: dict[str, float] = {}
+
+    def add_stacks(s: Span, prefix: str):
+        stack = f"{prefix};{s.name}" if prefix else s.name
+        self_seconds = s.wall_seconds - sum(child.wall_seconds for child in s.children)
+        self_times[stack] = self_times.get(stack, 0.0) + max(self_seconds, 0.0)
+        for child in s.children:
+            add_stacks(child, stack)
+
+    add_stacks(root, "")
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, seconds in self_times.items():
+            f.write(f"{stack} {round(seconds * 1e6)}\n")
+
+
+def export_span_tree(root: Span, directory: Path, stem: str) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    chrome_trace_path = directory / f"{stem}.trace.json"
+    write_chrome_trace(root, chrome_trace_path)
+    folded_path = directory / f"{stem}.folded"
+    write_folded_stacks(root, folded_path)
+    return [chrome_trace_path, folded_path]
+
+
+@contextmanager
+def timer(name: str = "total"):
+    """
+    opens a root span and prints its duration to stderr when done, along with a breakdown of any spans nested in it;
+    if the `ADVENT_TRACE_DIR` environment variable is set, the span tree is also exported there
+    """
+    root = Span(name)
+    try:
+        with span(name) as root:
+            yield root
     finally:
-        duration = time.perf_counter() - time_start
-        print(f"[{duration:.3f} seconds]", file=sys.stderr)
+        print(f"[{root.wall_seconds:.3f} seconds]", file=sys.stderr)
+        if len(root.children) > 0:
+            print("\n".join(format_span_tree(root)), file=sys.stderr)
+        if len(memo_stats_lines := format_memo_stats()) > 0:
+            print("\n".join(memo_stats_lines), file=sys.stderr)
+        if trace_dir := os.environ.get("ADVENT_TRACE_DIR"):
+            stem = Path(sys.argv[0]).stem or name
+            for path in export_span_tree(root, Path(trace_dir), stem):
+                print(f"wrote {path}", file=sys.stderr)
+
+
+PartsExecutor = Literal["serial", "threads", "processes"]
+PARTS_EXECUTORS: tuple[PartsExecutor, ...] = get_args(PartsExecutor)
+
+
+class Part(NamedTuple):
+    """one piece of a day's solution, called with the results of the parts it comes `after`, in that order"""
+    name: str
+    func: Callable[..., Any]
+    after: tuple[str, ...] = ()
+
+
+def _run_part(name: str, func: Callable[..., Any], *after_results: Any) -> Any:
+    with span(name):
+        return func(*after_results)
+
+
+def run_parts(parts: Iterable[Part], *, executor: PartsExecutor = "serial") -> dict[str, Any]:
+    """
+    runs each part as soon as the parts it comes after are done, and returns all their results by name;
+    with "threads" or "processes", parts that don't depend on each other run at the same time
+    (threads only pay off on a free-threaded build or when the parts spend their time in numpy,
+    and processes need parts that pickle, so module-level functions or `functools.partial`s of them)
+    """
+    parts = list(parts)
+    names = {part.name for part in parts}
+    if len(names) < len(parts):
+        raise ValueError("part names must be unique")
+    for part in parts:
+        if unknown := set(part.after) - names:
+            raise ValueError(f"part {part.name!r} comes after unknown part(s) {sorted(unknown)}")
+    if executor == "threads":
+        pool = concurrent_futures.ThreadPoolExecutor(max_workers=len(parts))
+    elif executor == "processes":
+        pool = concurrent_futures.ProcessPoolExecutor(max_workers=min(len(parts), os.cpu_count() or 1))
+    elif executor == "serial":
+        pool = None
+    else:
+        raise ValueError(f"unknown executor {executor!r}, expected one of {PARTS_EXECUTORS}")
+
+    results: dict[str, Any] = {}
+    pending = parts
+    running: dict[concurrent_futures.Future, Part] = {}
+    with pool if pool is not None else nullcontext():
+        while len(pending) > 0 or len(running) > 0:
+            ready = [part for part in pending if all(name in results for name in part.after)]
+            if len(ready) == 0 and len(running) == 0:
+                raise ValueError(f"parts {[part.name for part in pending]} depend on each other")
+            pending = [part for part in pending if part not in ready]
+            for part in ready:
+                after_results = [results[name] for name in part.after]
+                if pool is None:
+                    results[part.name] = _run_part(part.name, part.func, *after_results)
+                elif executor == "threads":  # in a copy of this context, so the part's span nests under the open one
+                    context = contextvars.copy_context()
+                    running[pool.submit(context.run, _run_part, part.name, part.func, *after_results)] = part
+                else:
+                    running[pool.submit(_run_part, part.name, part.func, *after_results)] = part
+            if len(running) > 0:
+                done, _ = concurrent_futures.wait(running, return_when=concurrent_futures.FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future).name] = future.result()
+    return results
+
+
+ParallelBackend = PartsExecutor  # the same three ways of running things
+PARALLEL_BACKENDS = PARTS_EXECUTORS
+
+
+def gil_enabled() -> bool:
+    """`False` only on a free-threaded build (like `python3.13t`) running without the GIL"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)  # new in 3.13
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def default_backend() -> ParallelBackend:
+    """threads if they can actually run Python code side by side, else processes"""
+    return "processes" if gil_enabled() else "threads"
+
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+
+def _split_chunks(items: Sequence[_Item], n_chunks: int) -> list[Sequence[_Item]]:
+    chunk_size = -(-len(items) // n_chunks)
+    return [items[i:(i + chunk_size)] for i in range(0, len(items), chunk_size)]
+
+
+def parallel_chunks(
+        func: Callable[[Sequence[_Item]], _Result],
+        items: Sequence[_Item],
+        *,
+        n_workers: int | None = None,
+        backend: ParallelBackend | None = None,
+        chunks_per_worker: int = 4,
+) -> list[_Result]:
+    """
+    `func` on consecutive chunks of `items`, spread over `n_workers` (default: one per CPU), with the results in order;
+    a few chunks per worker even out chunks that take longer than others, without a task per item.
+    the backend defaults to `default_backend()`; with "processes", `func` and the items have to pickle.
+    with one worker (or "serial"), `func` just gets all of `items` in this thread
+    """
+    n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+    backend = backend if backend is not None else default_backend()
+    if backend not in PARALLEL_BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {PARALLEL_BACKENDS}")
+    if n_workers == 1 or backend == "serial" or len(items) <= 1:
+        return [func(items)]
+    chunks = _split_chunks(items, n_workers * chunks_per_worker)
+    if backend == "threads":
+        pool = concurrent_futures.ThreadPoolExecutor(max_workers=n_workers)
+    else:
+        pool = concurrent_futures.ProcessPoolExecutor(max_workers=n_workers)
+    with pool:
+        return list(pool.map(func, chunks))
+
+
+def _map_chunk(func: Callable[[_Item], _Result], chunk: Sequence[_Item]) -> list[_Result]:
+    return [func(item) for item in chunk]
+
+
+def parallel_map(func: Callable[[_Item], _Result], items: Sequence[_Item], **kwargs) -> list[_Result]:
+    """`[func(item) for item in items]`, run in chunks by `parallel_chunks` (which takes the `kwargs`)"""
+    chunk_results = parallel_chunks(functools.partial(_map_chunk, func), items, **kwargs)
+    return list(itertools.chain.from_iterable(chunk_results))
+
+
+class PerWorker(Generic[_Result]):
+    """
+    a separate `factory()` for each thread that asks for one, for mutable state (like memo tables) that
+    parallel workers shouldn't share; worker processes get their own anyway
+    """
+
+    def __init__(self, factory: Callable[[], _Result]):
+        self._factory = factory
+        self._local = threading.local()
+
+    def get(self) -> _Result:
+        try:
+            return self._local.value
+        except AttributeError:
+            value = self._local.value = self._factory()
+            return value
+
+    def clear(self):
+        """every thread gets a new `factory()` on its next `get`"""
+        self._local = threading.local()
+
+
+class MemoStats:
+    """counts for one memoized function, added up over all of its caches (one per instance, for methods)"""
+
+    def __init__(self, name: str, maxsize: int | None):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._memos: weakref.WeakSet[Callable] = weakref.WeakSet()
+
+    def __repr__(self) -> str:
+        return f"MemoStats({self.name!r}, hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+    @property
+    def n_entries(self) -> int:
+        return sum(len(memo.entries) for memo in self._memos)
+
+    @property
+    def memory_bytes(self) -> int:
+        """shallow estimate: the tables themselves plus each key and value, but not what those refer to"""
+        return sum(
+            sys.getsizeof(memo.entries) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in memo.entries.items())
+            for memo in list(self._memos)
+        )
+
+
+_all_memo_stats: list[MemoStats] = []
+
+
+_MISSING = object()
+
+MemoPolicy = Literal["lru", "fifo"]
+
+
+def _make_memo(func: Callable, stats: MemoStats, policy: MemoPolicy) -> Callable:
+    """a closure, not a class with `__call__`, since it sits on hot recursive paths"""
+    maxsize = stats.maxsize
+    move_on_hit = (policy == "lru") and (maxsize is not None)
+    entries: dict[Hashable, Any] = OrderedDict() if move_on_hit else {}
+
+    def memo(*args, **kwargs):
+        key = args if len(kwargs) == 0 else (args, tuple(sorted(kwargs.items())))
+        value = entries.get(key, _MISSING)
+        if value is not _MISSING:
+            stats.hits += 1
+            if move_on_hit:
+                entries.move_to_end(key)
+            return value
+        stats.misses += 1
+        value = func(*args, **kwargs)
+        entries[key] = value
+        if maxsize is not None and len(entries) > maxsize:
+            del entries[next(iter(entries))]  # the oldest entry, or with "lru" the least recently used
+            stats.evictions += 1
+        return value
+
+    memo.entries = entries
+    memo.cache_clear = entries.clear  # as on `functools.lru_cache`
+    stats._memos.add(memo)
+    return memo
+
+
+def _check_memo_args(maxsize: int | None, policy: MemoPolicy):
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be >= 1")
+    if policy not in ("lru", "fifo"):
+        raise ValueError(f"unknown policy: {policy!r}")
+
+
+def memoize(func: Callable | None = None, *, maxsize: int | None = None, policy: MemoPolicy = "lru") -> Callable:
+    """
+    caches a function's results like `functools.cache`, but counts hits, misses and evictions (see `memo_stats`);
+    with `maxsize`, the least recently used (`policy="lru"`) or oldest (`policy="fifo"`) entry is evicted
+    once there are more than that many. use `memoize_method` for methods
+    """
+    _check_memo_args(maxsize, policy)
+
+    def decorator(f: Callable) -> Callable:
+        stats = MemoStats(f"{f.__module__}.{f.__qualname__}", maxsize)
+        _all_memo_stats.append(stats)
+        wrapper = functools.update_wrapper(_make_memo(f, stats, policy), f)
+        wrapper.stats = stats
+        return wrapper
+
+    return decorator if func is None else decorator(func)
+
+
+class memoize_method:
+    """
+    `memoize` for methods: each instance gets its own cache, stored on the instance and freed along with it
+    (where `functools.cache` on a method has one table for the class, which keeps every `self` alive)
+    """
+
+    def __init__(self, func: Callable | None = None, *, maxsize: int | None = None, policy: MemoPolicy = "lru"):
+        super().__init__()
+        _check_memo_args(maxsize, policy)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.attr_name: str | None = None
+        if func is not None:
+            self(func)
+
+    def __call__(self, func: Callable) -> Self:  # for `@memoize_method(maxsize=...)`
+        self.func = func
+        functools.update_wrapper(self, func)
+        self.stats = MemoStats(f"{func.__module__}.{func.__qualname__}", self.maxsize)
+        _all_memo_stats.append(self.stats)
+        return self
+
+    def __set_name__(self, owner: type, name: str):
+        self.attr_name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Callable:
+        if instance is None:
+            return self
+        # like `functools.cached_property`: the bound cache goes in the instance's `__dict__`,
+        # which shadows this (non-data) descriptor on every later lookup
+        memo = _make_memo(functools.partial(self.func, instance), self.stats, self.policy)
+        instance.__dict__[self.attr_name] = memo
+        return memo
+
+
+def memo_stats() -> list[MemoStats]:
+    return list(_all_memo_stats)
+
+
+def format_memo_stats() -> list[str]:
+    """one line per memoized function that has been called at all"""
+    lines = []
+    for stats in _all_memo_stats:
+        n_calls = stats.hits + stats.misses
+        if n_calls == 0:
+            continue
+        line = (
+            f"{stats.name:<40} {stats.hits:>9} hits {stats.misses:>9} misses"
+            f" ({stats.hits / n_calls:6.1%} hit rate) {stats.evictions:>9} evicted"
+            f" {stats.n_entries:>9} entries {stats.memory_bytes / 2 ** 20:9.2f} MiB"
+        )
+        lines.append(line)
+    return lines
 
 
 _Tup = TypeVar("_Tup", bound=tuple)
@@ -56,8 +610,26 @@ class GridCardinalDirection(Enum):
     LEFT = Direction(0, -1)
 
     @classmethod
-    def values(cls) -> list[Direction]:
-        return [e.value for e in cls]
+    def values(cls) -> tuple[Direction, ...]:
+        return _CARDINAL_DIRECTIONS
+
+
+_CARDINAL_DIRECTIONS = tuple(e.value for e in GridCardinalDirection)  # built once; `values()` is called in hot loops
+
+
+def _shifted_slices(direction: Direction) -> tuple[tuple[slice, slice], tuple[slice, slice]]:
+    """
+    index pairs `(here, there)` for a 2D array, such that `array[there]` holds the neighbor in `direction`
+    of each cell of `array[here]` (cells whose neighbor would be off the grid are left out of both)
+    """
+    def axis_slices(shift: int) -> tuple[slice, slice]:
+        if shift >= 0:
+            return slice(0, (-shift) or None), slice(shift, None)
+        return slice(-shift, None), slice(0, shift)
+
+    row_here, row_there = axis_slices(direction.row_shift)
+    col_here, col_there = axis_slices(direction.col_shift)
+    return (row_here, col_here), (row_there, col_there)
 
 
 class Loc(NamedTuple):
@@ -68,7 +640,76 @@ class Loc(NamedTuple):
         return Loc(self.row + direction.row_shift, self.col + direction.col_shift)
 
     def manhattan_distance(self, other: "Loc") -> int:
-        return sum(abs(a - b) for a, b in zip(self, other))
+        return abs(self.row - other.row) + abs(self.col - other.col)
+
+
+class LocPacker:
+    """
+    encodes locations as single ints (`row * stride + col`, give or take a margin),
+    which are much cheaper to create, hash and compare than `Loc`s;
+    adding `offset(direction)` to a code gives the code of the shifted location.
+    codes are distinct for all locations with a column in `range(-margin, n_cols + margin)`, for any row
+    """
+
+    def __init__(self, n_cols: int, *, margin: int = 0):
+        super().__init__()
+        if n_cols < 1 or margin < 0:
+            raise ValueError("n_cols must be positive and margin must not be negative")
+        self.margin = margin
+        self.stride = n_cols + 2 * margin
+
+    def pack(self, loc: Loc) -> int:
+        return loc.row * self.stride + loc.col + self.margin
+
+    def unpack(self, code: int) -> Loc:
+        row, col = divmod(code, self.stride)
+        return Loc(row, col - self.margin)
+
+    def offset(self, direction: Direction) -> int:
+        return direction.row_shift * self.stride + direction.col_shift
+
+
+def parse_grid(raw: bytes | str) -> np.ndarray:
+    """
+    turns equal-length lines of text into a 2D uint8 array of character codes (compare cells against `ord(symbol)`),
+    reshaping the raw bytes directly instead of building a python object per character
+    """
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    raw = raw.strip()
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n")
+    n_cols = raw.find(b"\n")
+    if n_cols == -1:  # only one line
+        n_cols = len(raw)
+    n_rows, remainder = divmod(len(raw) + 1, n_cols + 1)
+    if remainder != 0:
+        raise ValueError("grid lines must all be the same length")
+    rows = np.frombuffer(raw + b"\n", dtype=np.uint8).reshape(n_rows, n_cols + 1)
+    if not np.all(rows[:, -1] == ord("\n")):
+        raise ValueError("grid lines must all be the same length")
+    return rows[:, :-1].copy()
+
+
+def _symbol_code(symbol: str | int) -> int:
+    return ord(symbol) if isinstance(symbol, str) else symbol
+
+
+def find_symbol(grid: np.ndarray, symbol: str | int) -> Loc:
+    """location of the single cell holding `symbol` (a character, or a character code)"""
+    rows, cols = np.nonzero(grid == _symbol_code(symbol))
+    if len(rows) != 1:
+        raise ValueError(f"expected exactly 1 {symbol!r} in the grid, but found {len(rows)}")
+    return Loc(int(rows[0]), int(cols[0]))
+
+
+def group_symbol_locs(grid: np.ndarray, *, ignore: str | int) -> dict[str, set[Loc]]:
+    """locations of every symbol in a grid of character codes, except for the `ignore` symbol"""
+    rows, cols = np.nonzero(grid != _symbol_code(ignore))
+    groups: dict[str, set[Loc]] = defaultdict(set)
+    for code, row, col in zip(grid[rows, cols].tolist(), rows.tolist(), cols.tolist()):
+        groups[chr(code)].add(Loc(row, col))
+    return dict(groups)
 
 
 class GridSolver:
@@ -86,5 +727,544 @@ class GridSolver:
     def n_cols(self) -> int:
         return self.grid.shape[1]
 
+    @property
+    def n_cells(self) -> int:
+        return self.n_rows * self.n_cols
+
     def is_loc_in_bounds(self, loc: Loc) -> bool:
         return 0 <= loc.row < self.n_rows and 0 <= loc.col < self.n_cols
+
+    def loc_to_index(self, loc: Loc) -> int:
+        """flat (row-major) index of a cell, as used by `neighbor_table`"""
+        return loc.row * self.n_cols + loc.col
+
+    def index_to_loc(self, index: int) -> Loc:
+        return Loc(*divmod(index, self.n_cols))
+
+    def neighbor_table(self, open_mask: np.ndarray | None = None) -> np.ndarray:
+        """
+        `(n_cells, 4)` int32 array holding, for each flat cell index, the flat index of its neighbor in each of the
+        `GridCardinalDirection` directions (in order), or -1 where that neighbor is off the grid or not in `open_mask`;
+        searches can then step through plain ints (use `.tolist()` for fast scalar lookups) instead of `Loc`s
+        """
+        indices = np.arange(self.n_cells, dtype=np.int32).reshape(self.n_rows, self.n_cols)
+        table = np.full((self.n_rows, self.n_cols, len(_CARDINAL_DIRECTIONS)), -1, dtype=np.int32)
+        for k, direction in enumerate(_CARDINAL_DIRECTIONS):
+            here, there = _shifted_slices(direction)
+            table[*here, k] = indices[there]
+        table = table.reshape(self.n_cells, len(_CARDINAL_DIRECTIONS))
+        if open_mask is not None:
+            if open_mask.shape != self.grid.shape:
+                raise ValueError("open_mask must be the same shape as the grid")
+            has_neighbor = table >= 0
+            has_neighbor[has_neighbor] = ~open_mask.reshape(-1)[table[has_neighbor]]  # now: neighbor is blocked
+            table[has_neighbor] = -1
+        return table
+
+    def padded(self, sentinel: int, *, width: int = 1) -> "PaddedGrid":
+        """the grid with a border of `sentinel`, so walks can stop on that value instead of checking bounds"""
+        return PaddedGrid(self.grid, sentinel, width=width)
+
+
+class PaddedGrid:
+    """
+    a copy of a grid with a `width`-cell border of `sentinel` all the way round (the dtype is widened if needed to
+    hold it), so a walk that steps at most `width` cells at a time off the grid lands on the sentinel.
+    `grid` is indexed by padded coordinates; `to_padded` / `to_original` (and the `_index` versions, for flat
+    row-major indices into `grid`) translate between those and coordinates on the original grid
+    """
+
+    def __init__(self, grid: np.ndarray, sentinel: int, *, width: int = 1):
+        super().__init__()
+        if len(grid.shape) != 2:
+            raise ValueError("grid must be 2-dimensional")
+        if width < 1:
+            raise ValueError("width must be >= 1")
+        dtype = np.result_type(grid.dtype, np.min_scalar_type(sentinel))
+        self.grid = np.pad(grid.astype(dtype, copy=False), width, constant_values=sentinel)
+        self.sentinel = sentinel
+        self.width = width
+
+    @property
+    def n_cols(self) -> int:
+        return self.grid.shape[1]
+
+    def to_padded(self, loc: Loc) -> Loc:
+        return Loc(loc.row + self.width, loc.col + self.width)
+
+    def to_original(self, loc: Loc) -> Loc:
+        return Loc(loc.row - self.width, loc.col - self.width)
+
+    def to_padded_index(self, loc: Loc) -> int:
+        """flat index into `grid` of a cell given in original coordinates"""
+        return (loc.row + self.width) * self.n_cols + loc.col + self.width
+
+    def to_original_loc(self, index: int) -> Loc:
+        row, col = divmod(index, self.n_cols)
+        return Loc(row - self.width, col - self.width)
+
+    def original_slices(self) -> tuple[slice, slice]:
+        """`grid[original_slices()]` is the original grid (as a view)"""
+        return slice(self.width, -self.width), slice(self.width, -self.width)
+
+    def flat_offsets(self, directions: Iterable[Direction]) -> list[int]:
+        """how far one step in each direction moves a flat index into `grid`"""
+        return [direction.row_shift * self.n_cols + direction.col_shift for direction in directions]
+
+
+def distance_field(open_mask: np.ndarray, sources: Iterable[Loc], *, target: Loc | None = None) -> np.ndarray:
+    """
+    breadth-first search from all `sources` at once, stepping between 4-adjacent cells of `open_mask`;
+    returns the number of steps to each cell as an int32 array, with -1 for cells that can't be reached.
+    the whole frontier is expanded per step with array operations, so the python overhead is per step, not per cell.
+    with a `target`, the search stops as soon as the target is reached (farther cells are left at -1)
+    """
+    if len(open_mask.shape) != 2 or open_mask.dtype != np.bool:
+        raise TypeError("open_mask must be a 2-dimensional boolean array")
+    # a closed border means no neighbor offset can wrap around onto another row, or off the array
+    padded = np.pad(open_mask, 1, constant_values=False)
+    n_cols_padded = padded.shape[1]
+    unvisited = padded.reshape(-1)  # np.pad made a copy, so this can be updated in-place
+    neighbor_offsets = np.array([
+        direction.row_shift * n_cols_padded + direction.col_shift
+        for direction in _CARDINAL_DIRECTIONS
+    ])
+    distances = np.full(padded.size, -1, dtype=np.int32)
+    frontier = np.unique(np.array(
+        [(loc.row + 1) * n_cols_padded + (loc.col + 1) for loc in sources],
+        dtype=np.int64,
+    ))
+    target_index = None if target is None else (target.row + 1) * n_cols_padded + (target.col + 1)
+    distances[frontier] = 0
+    unvisited[frontier] = False
+    n_steps = 0
+    while frontier.size > 0 and (target_index is None or distances[target_index] < 0):
+        n_steps += 1
+        candidates = (frontier[:, np.newaxis] + neighbor_offsets).reshape(-1)
+        frontier = np.unique(candidates[unvisited[candidates]])
+        distances[frontier] = n_steps
+        unvisited[frontier] = False
+    return distances.reshape(padded.shape)[1:-1, 1:-1].copy()
+
+
+def grid_edges(grid: np.ndarray, *, mask: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    flat (row-major) index pairs of 4-adjacent cells holding equal values, each pair once, both cells in `mask`;
+    e.g. to feed to `DisjointSet.union_many`
+    """
+    if len(grid.shape) != 2:
+        raise ValueError("grid must be 2-dimensional")
+    if mask is None:
+        mask = np.ones(grid.shape, dtype=bool)
+    indices = np.arange(grid.size, dtype=np.int64).reshape(grid.shape)
+    edges_a, edges_b = [], []
+    for direction in (GridCardinalDirection.RIGHT.value, GridCardinalDirection.DOWN.value):
+        here, there = _shifted_slices(direction)
+        linked = mask[here] & mask[there] & (grid[here] == grid[there])
+        edges_a.append(indices[here][linked])
+        edges_b.append(indices[there][linked])
+    return np.concatenate(edges_a), np.concatenate(edges_b)
+
+
+class DisjointSet:
+    """
+    union-find over the elements `0 .. n - 1`, held in numpy int arrays:
+    single unions go by rank and finds halve their paths; `union_many` joins a whole array of edges at once,
+    hooking roots onto smaller roots (so it never makes a cycle) and compressing every path between rounds.
+    `sizes[root]` is the size of that root's set
+    """
+
+    def __init__(self, n: int):
+        super().__init__()
+        if n < 0:
+            raise ValueError("n must not be negative")
+        self.parents = np.arange(n, dtype=np.int64)
+        self.ranks = np.zeros(n, dtype=np.int32)
+        self.sizes = np.ones(n, dtype=np.int64)
+        self.n_components = n
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def find(self, x: int) -> int:
+        parents = self.parents
+        while (parent := int(parents[x])) != x:
+            grandparent = int(parents[parent])
+            parents[x] = grandparent  # path halving
+            x = grandparent
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """joins the sets of `a` and `b`; returns whether they were separate"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.ranks[root_a] < self.ranks[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parents[root_b] = root_a
+        self.sizes[root_a] += self.sizes[root_b]
+        if self.ranks[root_a] == self.ranks[root_b]:
+            self.ranks[root_a] += 1
+        self.n_components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x: int) -> int:
+        return int(self.sizes[self.find(x)])
+
+    def _compress(self):
+        """points every element straight at its root, by pointer jumping"""
+        while True:
+            grandparents = self.parents[self.parents]
+            if np.array_equal(grandparents, self.parents):
+                return
+            self.parents = grandparents
+
+    def union_many(self, edges_a: np.ndarray, edges_b: np.ndarray):
+        if edges_a.shape != edges_b.shape:
+            raise ValueError("edges_a and edges_b must be the same shape")
+        edges_a, edges_b = edges_a.reshape(-1), edges_b.reshape(-1)
+        roots_old = self.roots()
+        while True:
+            self._compress()
+            roots_a, roots_b = self.parents[edges_a], self.parents[edges_b]
+            separate = roots_a != roots_b
+            if not separate.any():
+                break
+            edges_a, edges_b = edges_a[separate], edges_b[separate]  # joined edges stay joined
+            roots_a, roots_b = roots_a[separate], roots_b[separate]
+            higher, lower = np.maximum(roots_a, roots_b), np.minimum(roots_a, roots_b)
+            np.minimum.at(self.parents, higher, lower)
+            np.maximum.at(self.ranks, lower, self.ranks[higher] + 1)
+        # roots that got hooked hand their sizes to their new roots
+        hooked = roots_old[self.parents[roots_old] != roots_old]
+        np.add.at(self.sizes, self.parents[hooked], self.sizes[hooked])
+        self.n_components -= len(hooked)
+
+    def roots(self) -> np.ndarray:
+        return np.flatnonzero(self.parents == np.arange(len(self)))
+
+    def labels(self) -> np.ndarray:
+        """the root of every element's set"""
+        self._compress()
+        return self.parents.copy()
+
+
+class BitSet:
+    """
+    a set of small non-negative ints, held as the bits of one Python int: about one bit per possible element instead
+    of ~100 bytes per element, and unions / intersections / differences run a machine word at a time.
+    use an `Indexer` (or `GridSolver.loc_to_index`) to turn other things into ints
+    """
+    __slots__ = ("bits",)
+
+    def __init__(self, items: Iterable[int] = ()):
+        super().__init__()
+        items = list(items)
+        if len(items) <= 8:
+            bits = 0
+            for item in items:
+                bits |= 1 << item
+        else:  # each `|=` above copies the whole int, so for many items, set the bits in a buffer instead
+            buffer = bytearray(max(items) // 8 + 1)
+            for item in items:
+                buffer[item >> 3] |= 1 << (item & 7)
+            bits = int.from_bytes(buffer, "little")
+        self.bits = bits
+
+    @classmethod
+    def from_bits(cls, bits: int) -> Self:
+        bit_set = object.__new__(cls)  # skips `__init__`; this gets called for every result of `|`, `&`, ...
+        bit_set.bits = bits
+        return bit_set
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> Self:
+        """bit `i` set where `mask.reshape(-1)[i]` is true"""
+        packed = np.packbits(mask.reshape(-1).astype(bool), bitorder="little")
+        return cls.from_bits(int.from_bytes(packed.tobytes(), "little"))
+
+    def to_mask(self, size: int) -> np.ndarray:
+        """flat boolean array of length `size` (which must cover every element)"""
+        if self.bits >> size:
+            raise ValueError(f"elements don't all fit in size {size}")
+        packed = np.frombuffer(self.bits.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+        return np.unpackbits(packed, count=size, bitorder="little").astype(bool)
+
+    def to_array(self) -> np.ndarray:
+        """the elements, ascending, as an int64 array"""
+        return np.flatnonzero(self.to_mask(self.bits.bit_length()))
+
+    def add(self, item: int):
+        self.bits |= 1 << item
+
+    def discard(self, item: int):
+        self.bits &= ~(1 << item)
+
+    def copy(self) -> Self:
+        return self.from_bits(self.bits)
+
+    def above(self, item: int) -> "BitSet":
+        """the elements greater than `item`"""
+        return BitSet.from_bits(self.bits >> (item + 1) << (item + 1))
+
+    def __contains__(self, item: int) -> bool:
+        return (self.bits >> item) & 1 == 1
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __iter__(self) -> Iterator[int]:
+        """ascending"""
+        bits = self.bits
+        if bits.bit_count() > bits.bit_length() >> 7:  # dense: searching the binary digits is cheaper
+            digits = bin(bits)[:1:-1]  # lowest bit first, so each position is the element
+            i = digits.find("1")
+            while i >= 0:
+                yield i
+                i = digits.find("1", i + 1)
+            return
+        while bits:  # sparse: peel off the lowest bit each time
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitSet):
+            return NotImplemented
+        return self.bits == other.bits
+
+    __hash__ = None  # mutable, like `set`
+
+    def __or__(self, other: "BitSet") -> "BitSet":
+        return BitSet.from_bits(self.bits | other.bits)
+
+    def __and__(self, other: "BitSet") -> "BitSet":
+        return BitSet.from_bits(self.bits & other.bits)
+
+    def __sub__(self, other: "BitSet") -> "BitSet":
+        return BitSet.from_bits(self.bits & ~other.bits)
+
+    def __xor__(self, other: "BitSet") -> "BitSet":
+        return BitSet.from_bits(self.bits ^ other.bits)
+
+    def __ior__(self, other: "BitSet") -> Self:
+        self.bits |= other.bits
+        return self
+
+    def __iand__(self, other: "BitSet") -> Self:
+        self.bits &= other.bits
+        return self
+
+    def __isub__(self, other: "BitSet") -> Self:
+        self.bits &= ~other.bits
+        return self
+
+    def issubset(self, other: "BitSet") -> bool:
+        return self.bits & ~other.bits == 0
+
+    def isdisjoint(self, other: "BitSet") -> bool:
+        return self.bits & other.bits == 0
+
+    def __repr__(self) -> str:
+        return f"BitSet({list(self)})"
+
+
+_Key = TypeVar("_Key", bound=Hashable)
+
+
+class Indexer(Generic[_Key]):
+    """numbers keys `0, 1, 2, ...` in the order they're first seen, so sets of them can be `BitSet`s"""
+
+    def __init__(self, keys: Iterable[_Key] = ()):
+        super().__init__()
+        self._indices: dict[_Key, int] = {}
+        self._keys: list[_Key] = []
+        for key in keys:
+            self.index(key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: _Key) -> bool:
+        return key in self._indices
+
+    def index(self, key: _Key) -> int:
+        """the key's index, giving it the next one if it's new"""
+        try:
+            return self._indices[key]
+        except KeyError:
+            index = self._indices[key] = len(self._keys)
+            self._keys.append(key)
+            return index
+
+    def key(self, index: int) -> _Key:
+        return self._keys[index]
+
+    def bit_set(self, keys: Iterable[_Key]) -> BitSet:
+        return BitSet(self.index(key) for key in keys)
+
+    def keys_of(self, bit_set: BitSet) -> list[_Key]:
+        return [self._keys[index] for index in bit_set]
+
+
+_State = TypeVar("_State", bound=Hashable)
+
+
+class ShortestPaths(Generic[_State]):
+    """
+    result of `shortest_paths`: the cost of each settled state, plus every predecessor through which it is reached
+    at that cost (so all optimal paths are kept, as a DAG, without copying any sets along the way)
+    """
+
+    def __init__(self, distances: dict[_State, int], predecessors: dict[_State, list[_State]], goals: list[_State]):
+        self.distances = distances
+        self.predecessors = predecessors
+        self.goals = goals  # goal states reached at the lowest cost, if a goal was given
+
+    @property
+    def goal_distance(self) -> int | None:
+        return self.distances[self.goals[0]] if len(self.goals) > 0 else None
+
+    def states_on_paths(self, ends: Iterable[_State]) -> set[_State]:
+        """every state on any optimal path to any of `ends`"""
+        to_return = set(ends)
+        to_visit = list(to_return)
+        while len(to_visit) > 0:
+            for predecessor in self.predecessors.get(to_visit.pop(), ()):
+                if predecessor not in to_return:
+                    to_return.add(predecessor)
+                    to_visit.append(predecessor)
+        return to_return
+
+    def count_paths(self, end: _State) -> int:
+        """number of distinct optimal paths from any start to `end`"""
+        counts: dict[_State, int] = {}
+        stack = [end]
+        while len(stack) > 0:  # iterative post-order, since the DAG may be far deeper than the recursion limit
+            state = stack[-1]
+            pending = [p for p in self.predecessors.get(state, ()) if p not in counts]
+            if len(pending) > 0:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            predecessors = self.predecessors.get(state, ())
+            counts[state] = sum(counts[p] for p in predecessors) if len(predecessors) > 0 else 1
+        return counts[end]
+
+
+def shortest_paths(
+        starts: Iterable[_State],
+        successors: Callable[[_State], Iterable[tuple[_State, int]]],
+        *,
+        is_goal: Callable[[_State], bool] | None = None,
+        heuristic: Callable[[_State], int] | None = None,
+) -> ShortestPaths[_State]:
+    """
+    Dijkstra's algorithm (or A*, given a `heuristic`) from all `starts` at cost 0;
+    `successors(state)` yields `(next_state, step_cost)` pairs with positive costs
+    (zero-cost steps work for distances, but can put cycles in the predecessors).
+    states can be anything hashable; plain ints (e.g. from `LocPacker`) are the cheapest.
+    with `is_goal`, the search stops once every state that could still tie the cheapest goal has been settled.
+    the heuristic must never overestimate the remaining cost, and must be consistent
+    (it drops by at most the cost of each step), or some optimal predecessors may be missed
+    """
+    distances: dict[_State, int] = {}
+    predecessors: dict[_State, list[_State]] = {}
+    settled: set[_State] = set()
+    goals: list[_State] = []
+    tiebreak = itertools.count()  # states don't need to be comparable
+    queue = []
+    for state in starts:
+        distances[state] = 0
+        predecessors[state] = []
+        queue.append((0 if heuristic is None else heuristic(state), next(tiebreak), state))
+    heapq.heapify(queue)
+    goal_distance = None
+    while len(queue) > 0:
+        priority, _, state = heapq.heappop(queue)
+        if goal_distance is not None and priority > goal_distance:
+            break
+        if state in settled:
+            continue
+        settled.add(state)
+        distance = distances[state]
+        if is_goal is not None and is_goal(state):
+            goals.append(state)
+            goal_distance = distance
+            continue  # no need to search past a goal
+        for state_next, step_cost in successors(state):
+            distance_next = distance + step_cost
+            distance_old = distances.get(state_next)
+            if distance_old is None or distance_next < distance_old:
+                distances[state_next] = distance_next
+                predecessors[state_next] = [state]
+                priority_next = distance_next if heuristic is None else distance_next + heuristic(state_next)
+                heapq.heappush(queue, (priority_next, next(tiebreak), state_next))
+            elif distance_next == distance_old:  # may already be settled, if the heuristic made a tie pop early
+                predecessors[state_next].append(state)
+    # states left in the queue were never settled; their distances are only upper bounds
+    distances = {state: distance for state, distance in distances.items() if state in settled}
+    predecessors = {state: [p for p in predecessors[state] if p in settled] for state in distances}
+    return ShortestPaths(distances, predecessors, goals)
+
+
+_SimState = TypeVar("_SimState")
+
+
+class Cycle(NamedTuple):
+    start: int  # steps from the initial state to the first one that comes around again
+    period: int
+
+
+def _same_state(state: Any) -> Any:
+    return state
+
+
+def find_cycle(
+        initial: _SimState,
+        step: Callable[[_SimState], _SimState | None],
+        *,
+        fingerprint: Callable[[_SimState], Hashable] | None = None,
+) -> Cycle | None:
+    """
+    Brent's algorithm: where the states `initial, step(initial), step(step(initial)), ...` start repeating,
+    or `None` if `step` returns `None` (the simulation is over) first.
+    only a couple of states are held at a time, instead of every state seen, for up to about 3x as many steps.
+    `step` must not change its argument in place. states are compared with `==`, or by `fingerprint(state)`
+    if given (e.g. `array_fingerprint`, since numpy arrays don't compare with a plain `==`)
+    """
+    key = fingerprint if fingerprint is not None else _same_state
+    # the period: the tortoise waits at each power of two for the hare to catch up with it
+    power = period = 1
+    tortoise_key = key(initial)
+    hare = step(initial)
+    while hare is not None and (hare_key := key(hare)) != tortoise_key:
+        if period == power:
+            tortoise_key = hare_key
+            power *= 2
+            period = 0
+        hare = step(hare)
+        period += 1
+    if hare is None:
+        return None
+    # the start: with the hare a period ahead, they first meet where the cycle begins
+    tortoise = hare = initial
+    for _ in range(period):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+    return Cycle(start, period)
+
+
+def array_fingerprint(array: np.ndarray) -> bytes:
+    """a 16-byte digest of the array's contents, to tell states apart without keeping them around"""
+    return hashlib.blake2b(np.ascontiguousarray(array), digest_size=16).digest()
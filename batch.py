@@ -0,0 +1,84 @@
+import contextlib
+import dataclasses
+import io
+import sys
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from advent_utils import use_input
+from runner import find_days, import_day
+
+
+@dataclasses.dataclass
+class BatchResult:
+    path: Path
+    output: str = ""
+    seconds: float | None = None
+    error: str | None = None
+
+
+def solve_one(day: int, path: Path) -> BatchResult:
+    """
+    parses and solves one input for the day, capturing what it prints;
+    the day's module stays imported, so its module-level caches carry over to the next input in this process
+    """
+    module = import_day(day)
+    result = BatchResult(path)
+    captured = io.StringIO()
+    time_start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(captured), use_input(path):
+            module.main(module.get_parsed_input())
+        result.seconds = time.perf_counter() - time_start
+    except Exception:
+        result.error = traceback.format_exc()
+    result.output = captured.getvalue()
+    return result
+
+
+def solve_many(day: int, paths: Iterable[Path], *, n_workers: int = 1) -> Iterator[BatchResult]:
+    """
+    yields a result per input as soon as it's done; with `n_workers > 1` the inputs are spread across worker processes,
+    each of which keeps its own warm caches (so results may come out of order)
+    """
+    if n_workers == 1:
+        for path in paths:
+            yield solve_one(day, path)
+        return
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=import_day, initargs=(day,)) as executor:
+        futures: list[Future[BatchResult]] = [executor.submit(solve_one, day, path) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="run one day on many inputs, keeping its caches warm between them")
+    arg_parser.add_argument("day", type=int)
+    arg_parser.add_argument("paths", nargs="+", type=Path, help="input files")
+    arg_parser.add_argument("--workers", type=int, default=1, help="worker processes (each keeps its own caches)")
+    args = arg_parser.parse_args()
+    if args.day not in find_days():
+        arg_parser.error(f"no module for day {args.day}")
+    time_start = time.perf_counter()
+    n_failed = 0
+    for result in solve_many(args.day, args.paths, n_workers=args.workers):
+        if result.error is None:
+            print(f"===== {result.path} [{result.seconds:.3f} seconds] =====")
+            print(result.output, end="")
+        else:
+            n_failed += 1
+            print(f"===== {result.path} FAILED =====")
+            print(result.output, end="")
+            print(result.error, end="")
+    wall_seconds = time.perf_counter() - time_start
+    print(f"[{len(args.paths)} inputs in {wall_seconds:.3f} seconds]", file=sys.stderr)
+    if n_failed > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+import contextlib
+import dataclasses
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Self
+
+from advent_utils import input_path, use_input
+from generators import write_inputs
+from runner import clear_caches, find_days, import_day
+
+PHASES = ("parse", "solve")
+
+
+@dataclasses.dataclass
+class TimingStats:
+    n_runs: int
+    min: float
+    median: float
+    p95: float
+    mean: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> Self:
+        if len(samples) == 0:
+            raise ValueError("need at least one sample")
+        if len(samples) == 1:
+            p95 = samples[0]
+        else:
+            p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1]
+        return cls(
+            n_runs=len(samples),
+            min=min(samples),
+            median=statistics.median(samples),
+            p95=p95,
+            mean=statistics.fmean(samples),
+        )
+
+
+def _time_call(func: Callable[[], Any]) -> tuple[float, Any]:
+    time_start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - time_start, result
+
+
+def benchmark_day(module: ModuleType, *, n_runs: int, n_warmup: int) -> dict[str, TimingStats]:
+    """
+    times `get_parsed_input` and `main` separately;
+    the input is re-parsed for every run, since some solutions modify it in-place, and caches kept across inputs are cleared
+    """
+    if n_runs < 1:
+        raise ValueError("n_runs must be >= 1")
+    samples: dict[str, list[float]] = {phase: [] for phase in PHASES}
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        for i in range(n_warmup + n_runs):
+            clear_caches(module)
+            parse_seconds, input_parsed = _time_call(module.get_parsed_input)
+            solve_seconds, _ = _time_call(lambda: module.main(input_parsed))
+            if i >= n_warmup:
+                samples["parse"].append(parse_seconds)
+                samples["solve"].append(solve_seconds)
+    return {phase: TimingStats.from_samples(phase_samples) for phase, phase_samples in samples.items()}
+
+
+BenchmarkResults = dict[int, dict[str, TimingStats]]
+
+
+def results_to_json(results: BenchmarkResults, *, scale: float | None = None) -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,  # None for the real puzzle inputs
+        "days": {
+            f"{day:02}": {phase: dataclasses.asdict(stats) for phase, stats in phase_stats.items()}
+            for day, phase_stats in results.items()
+        },
+    }
+
+
+def results_from_json(data: dict[str, Any]) -> BenchmarkResults:
+    return {
+        int(day_str): {phase: TimingStats(**stats) for phase, stats in phase_stats.items()}
+        for day_str, phase_stats in data["days"].items()
+    }
+
+
+@dataclasses.dataclass
+class Regression:
+    day: int
+    phase: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds
+
+
+def find_regressions(
+        results: BenchmarkResults,
+        baseline: BenchmarkResults,
+        *,
+        tolerance: float,
+        min_seconds: float,
+) -> list[Regression]:
+    """
+    compares medians; a phase regresses if it is more than `tolerance` (fractional) slower than the baseline,
+    ignoring differences smaller than `min_seconds`, which are mostly noise
+    """
+    regressions = []
+    for day, phase_stats in results.items():
+        for phase, stats in phase_stats.items():
+            try:
+                baseline_stats = baseline[day][phase]
+            except KeyError:  # nothing to compare against
+                continue
+            slower_by = stats.median - baseline_stats.median
+            if slower_by > min_seconds and stats.median > baseline_stats.median * (1 + tolerance):
+                regressions.append(Regression(day, phase, baseline_stats.median, stats.median))
+    return regressions
+
+
+def print_results(results: BenchmarkResults, baseline: BenchmarkResults | None):
+    header = f"{'day':>3}  {'phase':<5}  {'min':>8}  {'median':>8}  {'p95':>8}"
+    if baseline is not None:
+        header += f"  {'baseline':>8}  {'change':>7}"
+    print(header)
+    for day, phase_stats in results.items():
+        for phase, stats in phase_stats.items():
+            line = f"{day:>3}  {phase:<5}  {stats.min:8.4f}  {stats.median:8.4f}  {stats.p95:8.4f}"
+            if baseline is not None and (baseline_stats := baseline.get(day, {}).get(phase)) is not None:
+                change = (stats.median / baseline_stats.median - 1) if baseline_stats.median > 0 else 0.0
+                line += f"  {baseline_stats.median:8.4f}  {change:+7.1%}"
+            print(line)
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="benchmark Advent of Code solutions and check for regressions")
+    arg_parser.add_argument("days", nargs="*", type=int, help="days to benchmark (default: all)")
+    arg_parser.add_argument("-n", "--runs", type=int, default=5, help="timed runs per day")
+    arg_parser.add_argument("--warmup", type=int, default=1, help="untimed runs per day, before the timed ones")
+    arg_parser.add_argument("-o", "--output", type=Path, help="write results to this JSON file")
+    arg_parser.add_argument("--baseline", type=Path, help="JSON file from a previous run to compare against")
+    arg_parser.add_argument("--tolerance", type=float, default=0.2, help="allowed fractional slowdown of the median")
+    arg_parser.add_argument("--min-seconds", type=float, default=0.005, help="ignore slowdowns smaller than this")
+    arg_parser.add_argument("--scale", type=float, help="use generated inputs this many times the puzzle's size")
+    arg_parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    args = arg_parser.parse_args()
+    available_days = find_days()
+    days = args.days or available_days
+    if missing_days := sorted(set(days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline_data = json.load(f)
+        if baseline_data.get("scale") != args.scale:
+            arg_parser.error(f"baseline was measured at --scale {baseline_data.get("scale")}, not {args.scale}")
+        baseline = results_from_json(baseline_data)
+
+    results: BenchmarkResults = {}
+    skipped_days: list[int] = []
+    with tempfile.TemporaryDirectory() as generated_dir:
+        generated_paths = {}
+        if args.scale is not None:
+            print(f"generating inputs at {args.scale}x scale ...", file=sys.stderr)
+            generated_paths = write_inputs(days, Path(generated_dir), scale=args.scale, seed=args.seed)
+        for day in days:
+            if day not in generated_paths and not input_path(day).exists():
+                skipped_days.append(day)
+                print(f"skipping day {day:02}: no input (pass --scale to generate one)", file=sys.stderr)
+                continue
+            print(f"benchmarking day {day:02} ...", file=sys.stderr)
+            with use_input(generated_paths[day]) if day in generated_paths else contextlib.nullcontext():
+                results[day] = benchmark_day(import_day(day), n_runs=args.runs, n_warmup=args.warmup)
+    print_results(results, baseline)
+    for day in skipped_days:
+        print(f"{day:>3}  (no input, skipped)")
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results_to_json(results, scale=args.scale), f, indent=2)
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, tolerance=args.tolerance, min_seconds=args.min_seconds)
+        for regression in regressions:
+            print(
+                f"REGRESSION: day {regression.day:02} {regression.phase}:"
+                f" {regression.baseline_seconds:.4f} -> {regression.current_seconds:.4f} seconds"
+                f" ({regression.ratio:.2f}x)",
+                file=sys.stderr,
+            )
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
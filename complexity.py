@@ -0,0 +1,119 @@
+import dataclasses
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from generators import GENERATORS, write_inputs
+from runner import find_days, import_day
+from verify import REFERENCE_MODE, day_modes, run_mode
+
+DEFAULT_EXPONENT_BOUND = 1.3  # a bit of slack over linear, for log factors and noise
+# declared growth, as the exponent of time against input size (cells, for grid days), where it's worse than linear
+EXPONENT_BOUNDS = {
+    (6, REFERENCE_MODE): 1.8,  # a walk for every visited cell
+    (6, "padded"): 1.8,
+    (6, "parallel"): 1.8,
+    (6, "find_cycle"): 1.8,
+    (8, REFERENCE_MODE): 2.2,  # every pair of same-frequency antennas
+    (9, REFERENCE_MODE): 2.2,  # `compact_disk2` scans from the start of the disk for every file
+}
+MIN_SECONDS = 0.01  # if even the biggest input solves faster than this, timing noise swamps the fit
+
+
+@dataclasses.dataclass
+class GrowthReport:
+    day: int
+    mode: str
+    sizes: list[float]  # relative to the puzzle's
+    seconds: list[float]
+    exponent: float
+    bound: float
+
+    @property
+    def measurable(self) -> bool:
+        return max(self.seconds) >= MIN_SECONDS
+
+    @property
+    def too_steep(self) -> bool:
+        return self.measurable and self.exponent > self.bound
+
+
+def fit_exponent(sizes: list[float], seconds: list[float]) -> float:
+    """slope of the least-squares line through (log size, log seconds)"""
+    slope, _ = np.polyfit(np.log(sizes), np.log(seconds), 1)
+    return slope.item()
+
+
+def generated_scales(day: int, scales: list[float]) -> list[float]:
+    """
+    the scales that give distinct generator sizes (days with a capped size can't go as far),
+    recomputed from the sizes actually used, since those get rounded
+    """
+    input_generator = GENERATORS[day]
+    actual_scales = {
+        (input_generator.scaled_size(scale) / input_generator.puzzle_size) ** input_generator.dims
+        for scale in scales
+    }
+    return sorted(actual_scales)
+
+
+def measure_growth(day: int, scales: list[float], *, mode: str, n_repeats: int, seed: int, directory: Path) -> GrowthReport:
+    module = import_day(day)
+    mode_kwargs = day_modes(module)[mode]
+    actual_scales = generated_scales(day, scales)
+    seconds = []
+    for scale in actual_scales:
+        path, = write_inputs([day], directory / f"scale{scale:g}", scale=scale, seed=seed).values()
+        seconds.append(min(run_mode(module, path, mode_kwargs)[1] for _ in range(n_repeats)))
+    bound = EXPONENT_BOUNDS.get((day, mode), DEFAULT_EXPONENT_BOUND)
+    return GrowthReport(day, mode, actual_scales, seconds, fit_exponent(actual_scales, seconds), bound)
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="fit how each day's solve time grows with generated input size")
+    arg_parser.add_argument("days", nargs="*", type=int, help="days to check (default: all)")
+    arg_parser.add_argument("--mode", help="mode to run, for days that have it (default: every mode)")
+    arg_parser.add_argument("--start", type=float, default=0.25, help="smallest input size, relative to the puzzle's")
+    arg_parser.add_argument("--factor", type=float, default=2.0, help="ratio between successive input sizes")
+    arg_parser.add_argument("--steps", type=int, default=5, help="number of input sizes")
+    arg_parser.add_argument("--repeat", type=int, default=2, help="runs per size; the fastest one counts")
+    arg_parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    args = arg_parser.parse_args()
+    if args.steps < 2 or args.factor <= 1:
+        arg_parser.error("need at least 2 steps, growing by a factor above 1")
+    available_days = find_days()
+    days = args.days or available_days
+    if missing_days := sorted(set(days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+    scales = [args.start * args.factor ** i for i in range(args.steps)]
+
+    reports = []
+    print(f"{'day':>3}  {'mode':<12}  {'exponent':>8}  {'bound':>5}  seconds at each scale")
+    with tempfile.TemporaryDirectory() as generated_dir:
+        for day in days:
+            if day not in GENERATORS:
+                print(f"{day:>3}  (no input generator)")
+                continue
+            if len(generated_scales(day, scales)) < 2:
+                print(f"{day:>3}  (input size can't vary over these scales)")
+                continue
+            modes = list(day_modes(import_day(day)))
+            if args.mode is not None:
+                modes = [mode for mode in modes if mode == args.mode]
+            for mode in modes:
+                report = measure_growth(
+                    day, scales, mode=mode, n_repeats=args.repeat, seed=args.seed, directory=Path(generated_dir),
+                )
+                reports.append(report)
+                seconds_str = "  ".join(f"{scale:g}x: {seconds:.4f}" for scale, seconds in zip(report.sizes, report.seconds))
+                status = "TOO STEEP  " if report.too_steep else ("" if report.measurable else "(too fast to tell)  ")
+                print(f"{day:>3}  {mode:<12}  {report.exponent:8.2f}  {report.bound:5.1f}  {status}{seconds_str}")
+    if any(report.too_steep for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
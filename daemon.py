@@ -0,0 +1,164 @@
+import contextlib
+import io
+import json
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterable, Iterator, TextIO
+
+from advent_utils import use_input
+from runner import find_days, import_day
+from verify import day_modes
+
+
+def load_days(days: Iterable[int]):
+    """
+    imports the days up front, so the first request for each doesn't pay for it (numpy included);
+    modules a day imports with `lazy_import` (PIL in day 14, tqdm in day 20) are loaded too, since reading their `__dict__` runs them
+    """
+    for day in days:
+        module = import_day(day)
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                vars(value)
+
+
+@contextlib.contextmanager
+def _request_input(request: dict[str, Any]) -> Iterator[Path]:
+    if "path" in request:
+        yield Path(request["path"])
+    elif "input" in request:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "input.txt"
+            path.write_text(request["input"], encoding="utf-8")
+            yield path
+    else:
+        raise ValueError("a request needs either a 'path' to an input file or the 'input' itself")
+
+
+def solve_request(request: dict[str, Any]) -> dict[str, Any]:
+    """
+    `request` names the "day" and gives either a "path" to the input or the "input" text,
+    optionally with a "mode" from the day's `MODES` and an "id" to echo back;
+    the response has the answers, what the day printed, and how long parsing and solving took
+    (or "error" with a traceback, if anything went wrong)
+    """
+    response: dict[str, Any] = {"id": request.get("id"), "ok": False}
+    captured = io.StringIO()
+    try:
+        module = import_day(int(request["day"]))
+        mode_kwargs = day_modes(module)[request["mode"]] if "mode" in request else {}
+        with (
+            _request_input(request) as path,
+            contextlib.redirect_stdout(captured),
+            contextlib.redirect_stderr(io.StringIO()),  # progress bars
+            use_input(path),
+        ):
+            time_start = time.perf_counter()
+            input_parsed = module.get_parsed_input()
+            time_parsed = time.perf_counter()
+            answers = module.main(input_parsed, **mode_kwargs)
+            time_solved = time.perf_counter()
+        response.update(
+            ok=True,
+            answers=None if answers is None else list(answers),
+            parse_seconds=(time_parsed - time_start),
+            solve_seconds=(time_solved - time_parsed),
+        )
+    except Exception:
+        response["error"] = traceback.format_exc()
+    response["output"] = captured.getvalue()
+    return response
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    return str(value)
+
+
+def handle_line(line: str) -> str:
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("a request should be a JSON object")
+    except ValueError as e:  # includes `json.JSONDecodeError`
+        response = {"id": None, "ok": False, "error": f"bad request: {e}"}
+    else:
+        response = solve_request(request)
+    return json.dumps(response, default=_json_default)
+
+
+def serve_stdio(stdin: TextIO, stdout: TextIO):
+    """one JSON request per line in, one JSON response per line out, until `stdin` closes"""
+    for line in stdin:
+        if line.strip():
+            stdout.write(handle_line(line) + "\n")
+            stdout.flush()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(handle_line(line.decode("utf-8")).encode("utf-8") + b"\n")
+
+
+def serve_socket(path: Path):
+    """
+    the same JSON-lines protocol on a Unix socket, any number of requests per connection;
+    connections are served one at a time, since capturing a day's output means swapping out `sys.stdout`
+    """
+    path.unlink(missing_ok=True)
+    with socketserver.UnixStreamServer(str(path), _RequestHandler) as server:
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def send_requests(path: Path, requests: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """client side of `serve_socket`: sends each request over one connection and yields its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        with sock.makefile("rwb") as stream:
+            for request in requests:
+                stream.write(json.dumps(request).encode("utf-8") + b"\n")
+                stream.flush()
+                yield json.loads(stream.readline())
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(
+        description="keep every day imported and answer JSON-lines solve requests, on stdin/stdout or a Unix socket",
+    )
+    arg_parser.add_argument("--socket", type=Path, metavar="PATH", help="listen on this Unix socket instead of stdin")
+    arg_parser.add_argument("--days", nargs="+", type=int, help="days to import up front (default: all)")
+    args = arg_parser.parse_args()
+    available_days = find_days()
+    days = args.days or available_days
+    if missing_days := sorted(set(days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+    time_start = time.perf_counter()
+    load_days(days)
+    where = args.socket if args.socket is not None else "stdin"
+    print(f"[{len(days)} days loaded in {time.perf_counter() - time_start:.3f} seconds; serving on {where}]", file=sys.stderr)
+    if args.socket is not None:
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # so a plain `kill` still removes the socket file
+        try:
+            serve_socket(args.socket)
+        except KeyboardInterrupt:
+            pass
+    else:
+        serve_stdio(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
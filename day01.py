@@ -1,21 +1,20 @@
 from collections import Counter
-from typing import cast
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, iter_input_chunks, timer
 
 InputData = list[tuple[int, int]]
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(1)
-    data = [
-        cast(tuple[int, int], tuple(map(int, line.split())))
-        for line in input_raw.strip().splitlines()
+    numbers = [
+        int(number)
+        for chunk in iter_input_chunks(1)
+        for number in chunk.split()
     ]
-    return data
+    return list(zip(numbers[::2], numbers[1::2], strict=True))
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     # part 1
     list1, list2 = map(sorted, zip(*input_parsed))
     total_diff = sum(abs(a - b) for a, b in zip(list1, list2))
@@ -27,6 +26,7 @@ def main(input_parsed: InputData):
         for a in list1
     )
     print(f"{total_similarity = }")
+    return Answers(total_diff, total_similarity)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 import itertools
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, read_input, timer
 
 SAFE_DIFFS_UP = {1, 2, 3}
 SAFE_DIFFS_DOWN = {-1, -2, -3}
@@ -26,7 +26,7 @@ def sequence_is_safe(sequence: list[int]) -> bool:
     return diffs.issubset(SAFE_DIFFS_UP) or diffs.issubset(SAFE_DIFFS_DOWN)
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     # part 1
     safe_count1 = 0
     for row in input_parsed:
@@ -44,6 +44,7 @@ def main(input_parsed: InputData):
                 safe_count2 += 1
                 break
     print(f"{safe_count2 = }")
+    return Answers(safe_count1, safe_count2)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,23 @@
 import numpy as np
 
-from advent_utils import Direction, GridSolver, Loc, read_input, timer
+from advent_utils import Answers, Direction, GridSolver, Loc, parse_grid, read_input_bytes, timer
 
 InputData = np.ndarray
 
-TARGET_1 = "XMAS"
+TARGET_1 = b"XMAS"  # iterating over bytes gives character codes, same as the grid holds
 
-TARGET_2 = np.array([
-    ["M", None, "M"],
-    [None, "A", None],
-    ["S", None, "S"],
-])
-TARGET_2_RELEVANT_COORDINATES = TARGET_2.nonzero()
+WILDCARD = "."
+TARGET_2 = parse_grid(
+    "M.M\n"
+    ".A.\n"
+    "S.S\n"
+)
+TARGET_2_RELEVANT_COORDINATES = (TARGET_2 != ord(WILDCARD)).nonzero()
 TARGET_2_RELEVANT_VALUES = TARGET_2[TARGET_2_RELEVANT_COORDINATES]
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(4)
-    input_parsed = np.array([list(row) for row in input_raw.strip().splitlines()])
-    return input_parsed
+    return parse_grid(read_input_bytes(4))
 
 
 def is_block_target2(block: np.ndarray) -> bool:
@@ -27,22 +26,29 @@ def is_block_target2(block: np.ndarray) -> bool:
     return np.all(block[TARGET_2_RELEVANT_COORDINATES] == TARGET_2_RELEVANT_VALUES).item()
 
 
+OFF_GRID = 0  # sentinel around the grid; never a letter of the target
+
+
 class Solver(GridSolver):
+    def __init__(self, grid: np.ndarray):
+        super().__init__(grid)
+        # wide enough that a word starting on the grid can run off it by its whole length without leaving the padding
+        self.padded_grid = self.padded(OFF_GRID, width=(len(TARGET_1) - 1))
+        self._cells: list[list[int]] = self.padded_grid.grid.tolist()
 
     def is_word_target1(self, start_loc: Loc, direction: Direction) -> bool:
+        """`start_loc` is in padded coordinates"""
         for i, target_letter in enumerate(TARGET_1):
             loc = start_loc.shift(direction * i)
-            if not self.is_loc_in_bounds(loc):
-                return False  # out of bounds
-            if self.grid[loc] != target_letter:
-                return False
+            if self._cells[loc.row][loc.col] != target_letter:
+                return False  # includes running off the grid
         return True
 
     def part1(self) -> int:
         count = 0
         for i in range(self.n_rows):
             for j in range(self.n_cols):
-                loc = Loc(i, j)
+                loc = self.padded_grid.to_padded(Loc(i, j))
                 for i_shift in (-1, 0 , 1):
                     for j_shift in (-1, 0, 1):
                         direction = Direction(i_shift, j_shift)
@@ -64,7 +70,7 @@ class Solver(GridSolver):
         return count
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     solver = Solver(input_parsed)
     # part 1
     count1 = solver.part1()
@@ -72,6 +78,7 @@ def main(input_parsed: InputData):
     # part 2
     count2 = solver.part2()
     print(f"{count2 = }")
+    return Answers(count1, count2)
 
 
 if __name__ == "__main__":
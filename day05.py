@@ -2,7 +2,7 @@ import functools
 from collections import defaultdict
 from typing import Literal, cast
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, read_input, timer
 
 Rule = tuple[str, str]
 Seq = list[str]
@@ -48,7 +48,7 @@ class RulesIndex:
             raise ValueError(f"confused! {a = } ; {b = } ; {relevant_rules = }")
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     rules, sequences = input_parsed
     print(f"{len(rules) = }")
     print(f"{len(sequences) = }")
@@ -70,6 +70,7 @@ def main(input_parsed: InputData):
             total_needed_sorting += middle_number
     print(f"{total_already_sorted = }")
     print(f"{total_needed_sorting = }")
+    return Answers(total_already_sorted, total_needed_sorting)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,13 @@
-from concurrent.futures import as_completed as futures_as_completed
-from concurrent.futures.thread import ThreadPoolExecutor
+import copy
+import functools
+from typing import Self
 
 import numpy as np
 
-from advent_utils import Direction, GridCardinalDirection, GridSolver, Loc, read_input, timer
+from advent_utils import (
+    PARALLEL_BACKENDS, Answers, Direction, GridCardinalDirection, GridSolver, Loc, ParallelBackend, find_cycle, find_symbol,
+    parallel_map, parse_grid, read_input_bytes, timer,
+)
 
 InputData = tuple[np.ndarray, Loc]
 
@@ -13,19 +17,10 @@ OPEN = "."
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(6)
-    input_lines = input_raw.strip().splitlines()
-    grid = np.array([
-        [char != WALL for char in line]
-        for line in input_lines
-    ])
-    for i, line in enumerate(input_lines):
-        for j, char in enumerate(line):
-            if char == START_MARKER:
-                start_loc = Loc(i, j)
-                return grid, start_loc
-    else:
-        raise ValueError(f"start marker {START_MARKER!r} not found")
+    grid_symbols = parse_grid(read_input_bytes(6))
+    grid = grid_symbols != ord(WALL)
+    start_loc = find_symbol(grid_symbols, START_MARKER)
+    return grid, start_loc
 
 
 class OffGrid(Exception):
@@ -45,6 +40,12 @@ class GuardSim(GridSolver):
         self.current_loc = self.start_loc
         self.current_direction: Direction = GridCardinalDirection.UP.value
 
+    def with_obstacle(self, loc: Loc) -> Self:
+        """a new sim back at the start, on a copy of the grid with a wall added at `loc`"""
+        grid_modified = self.grid.copy()
+        grid_modified[loc] = False
+        return type(self)(grid_modified, self.start_loc)
+
     def turn_right(self):
         self.current_direction = self.current_direction.rot_clockwise()
 
@@ -73,11 +74,117 @@ class GuardSim(GridSolver):
                 raise InfiniteLoop
             history.add(new_history_entry)
 
+    @property
+    def state(self) -> tuple[Loc, Direction]:
+        return self.current_loc, self.current_direction
+
+    def next_state(self, state: tuple[Loc, Direction]) -> tuple[Loc, Direction] | None:
+        """the state one step on from `state` (turning right counts as a step), or `None` once off the grid"""
+        loc, direction = state
+        next_loc = loc.shift(direction)
+        if not self.is_loc_in_bounds(next_loc):
+            return None
+        if self.grid[next_loc]:
+            return next_loc, direction
+        return loc, direction.rot_clockwise()
+
+
+OFF_GRID = -1  # sentinel around the (boolean) grid
+
+_DIRECTIONS = GridCardinalDirection.values()  # in clockwise order, so turning right is the next one
+_START_DIRECTION_INDEX = _DIRECTIONS.index(GridCardinalDirection.UP.value)
+
+GuardState = tuple[int, int]  # (flat index into the padded grid, index into `_DIRECTIONS`)
+
+
+class PaddedGuardSim(GridSolver):
+    """`GuardSim` on flat indices of the padded grid: no bounds checks, no `Loc`s, and obstacles don't copy the grid"""
+
+    def __init__(self, grid: np.ndarray, start_loc: Loc):
+        if grid.dtype != np.bool:
+            raise TypeError("grid must contain booleans")
+        super().__init__(grid)
+        self.start_loc = start_loc
+        # the walk steps through flat indices of the padded grid, and leaves the grid when it lands on `OFF_GRID`
+        self.padded_grid = self.padded(OFF_GRID)
+        self._cells: list[int] = self.padded_grid.grid.reshape(-1).tolist()
+        self._offsets = self.padded_grid.flat_offsets(_DIRECTIONS)
+        self.current_index = self.padded_grid.to_padded_index(start_loc)
+        self.current_direction_index = _START_DIRECTION_INDEX
+        self._obstacle_index = -1  # an extra wall, from `with_obstacle`
+
+    def with_obstacle(self, loc: Loc) -> Self:
+        """
+        a new sim back at the start, with a wall added at `loc`; it shares this one's padded cells instead of
+        padding (or even copying) the grid again, so its `grid` and `padded_grid` don't show the new wall
+        """
+        sim = copy.copy(self)
+        sim._obstacle_index = self.padded_grid.to_padded_index(loc)
+        sim.current_index = self.padded_grid.to_padded_index(self.start_loc)
+        sim.current_direction_index = _START_DIRECTION_INDEX
+        return sim
+
+    @property
+    def current_loc(self) -> Loc:
+        return self.padded_grid.to_original_loc(self.current_index)
+
+    @property
+    def current_direction(self) -> Direction:
+        return _DIRECTIONS[self.current_direction_index]
+
+    def turn_right(self):
+        self.current_direction_index = (self.current_direction_index + 1) % len(_DIRECTIONS)
+
+    def step_forward(self) -> bool:
+        next_index = self.current_index + self._offsets[self.current_direction_index]
+        cell = self._cells[next_index]
+        if cell == OFF_GRID:
+            raise OffGrid
+        if cell and next_index != self._obstacle_index:  # can step forward
+            self.current_index = next_index
+            return True
+        else:  # wall
+            return False
+
+    def walk(self) -> set[Loc]:
+        history: set[GuardState] = set()
+        history.add((self.current_index, self.current_direction_index))
+        while True:
+            try:
+                could_step = self.step_forward()
+            except OffGrid:
+                return {self.padded_grid.to_original_loc(index) for index, _ in history}
+            if not could_step:  # hit a wall
+                self.turn_right()
+            new_history_entry = (self.current_index, self.current_direction_index)
+            if new_history_entry in history:  # doomed to repeat itself, as they say
+                raise InfiniteLoop
+            history.add(new_history_entry)
 
-def is_infinite_loop(grid: np.ndarray, start_loc: Loc, *, loc_modification: Loc) -> bool:
-    grid_modified = grid.copy()
-    grid_modified[loc_modification] = False  # place an obstacle
-    modified_guard_sim = GuardSim(grid_modified, start_loc)
+    @property
+    def state(self) -> GuardState:
+        return self.current_index, self.current_direction_index
+
+    def next_state(self, state: GuardState) -> GuardState | None:
+        """the state one step on from `state` (turning right counts as a step), or `None` once off the grid"""
+        index, direction_index = state
+        next_index = index + self._offsets[direction_index]
+        cell = self._cells[next_index]
+        if cell == OFF_GRID:
+            return None
+        if cell and next_index != self._obstacle_index:
+            return next_index, direction_index
+        return index, (direction_index + 1) % len(_DIRECTIONS)
+
+
+def is_infinite_loop(guard_sim: GuardSim | PaddedGuardSim, loc_modification: Loc, *, use_find_cycle: bool = True) -> bool:
+    """
+    thread-safe: the sim with the obstacle is a new one, and whatever it shares with `guard_sim` is only read;
+    without `use_find_cycle`, the walk remembers every state it has been through, as the reference
+    """
+    modified_guard_sim = guard_sim.with_obstacle(loc_modification)  # place an obstacle
+    if use_find_cycle:
+        return find_cycle(modified_guard_sim.state, modified_guard_sim.next_state) is not None
     try:
         modified_guard_sim.walk()
     except InfiniteLoop:
@@ -86,37 +193,46 @@ def is_infinite_loop(grid: np.ndarray, start_loc: Loc, *, loc_modification: Loc)
         return False
 
 
-def main(input_parsed: InputData, *, use_threads: bool = True):
+MODES = {
+    "reference": {"n_workers": 1, "use_padding": False, "use_find_cycle": False},
+    "padded": {"n_workers": 1, "use_padding": True, "use_find_cycle": False},
+    "find_cycle": {"n_workers": 1, "use_padding": True, "use_find_cycle": True},
+    "parallel": {"n_workers": 4, "use_padding": True, "use_find_cycle": True},
+}
+
+
+def main(
+        input_parsed: InputData,
+        *,
+        n_workers: int | None = None,
+        backend: ParallelBackend | None = None,
+        use_padding: bool = True,
+        use_find_cycle: bool = True,
+) -> Answers:
     grid, start_loc = input_parsed
     # part 1
-    initial_guard_sim = GuardSim(grid, start_loc)
+    initial_guard_sim = (PaddedGuardSim if use_padding else GuardSim)(grid, start_loc)
     locs_visited = initial_guard_sim.walk()
     print(f"{len(locs_visited) = }")
     # part 2
-    print(f"{use_threads = }")
-    locs_to_modify = locs_visited - {start_loc}
-    if use_threads:
-        with ThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(is_infinite_loop, grid, start_loc, loc_modification=loc_modification)
-                for loc_modification in locs_to_modify
-            ]
-            infinite_loops_count = sum(
-                future.result()
-                for future in futures_as_completed(futures)
-            )
-    else:
-        infinite_loops_count = sum(
-            is_infinite_loop(grid, start_loc, loc_modification=loc_modification)
-            for loc_modification in locs_to_modify
-        )
+    locs_to_modify = sorted(locs_visited - {start_loc})
+    infinite_loops_count = sum(parallel_map(
+        functools.partial(is_infinite_loop, initial_guard_sim, use_find_cycle=use_find_cycle), locs_to_modify, n_workers=n_workers, backend=backend,
+    ))
     print(f"{infinite_loops_count = }")
+    return Answers(len(locs_visited), infinite_loops_count)
 
 
 if __name__ == "__main__":
     from argparse import ArgumentParser
     arg_parser = ArgumentParser()
-    arg_parser.add_argument("--no-threads", action="store_true")
+    arg_parser.add_argument("--workers", type=int, help="workers checking obstacles (default: one per CPU)")
+    arg_parser.add_argument("--backend", choices=PARALLEL_BACKENDS, help="default: threads if the GIL is off, else processes")
+    arg_parser.add_argument("--no-padding", action="store_true", help="walk with `Loc`s and bounds checks")
+    arg_parser.add_argument("--no-find-cycle", action="store_true", help="check for loops by remembering every step")
     args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input(), use_threads=(not args.no_threads))
+        main(
+            get_parsed_input(), n_workers=args.workers, backend=args.backend,
+            use_padding=(not args.no_padding), use_find_cycle=(not args.no_find_cycle),
+        )
@@ -1,4 +1,8 @@
-from advent_utils import read_input, timer
+import functools
+
+from advent_utils import (
+    PARALLEL_BACKENDS, PARTS_EXECUTORS, Answers, ParallelBackend, Part, PartsExecutor, parallel_chunks, read_input, run_parts, timer,
+)
 
 Operands = list[int]
 InputData = list[tuple[int, Operands]]
@@ -65,23 +69,55 @@ class Solver:
         return self._is_equality_possible_recursive(operands[1:], total_so_far=operands[0])
 
 
-def main(input_parsed: InputData):
-    # part 1
-    solvable_sum1 = sum(
+def solvable_sum(
+        input_parsed: InputData, *, use_concat: bool, n_workers: int | None = 1, backend: ParallelBackend | None = None,
+) -> int:
+    """with more than one worker, each sums a share of the equations (a `Solver` per equation, so none is shared)"""
+    if n_workers != 1:
+        chunk_sums = parallel_chunks(
+            functools.partial(solvable_sum, use_concat=use_concat), input_parsed, n_workers=n_workers, backend=backend,
+        )
+        return sum(chunk_sums)
+    return sum(
         target
         for target, operands in input_parsed
-        if Solver(target, use_concat=False).is_equality_possible(operands)
+        if Solver(target, use_concat=use_concat).is_equality_possible(operands)
     )
+
+
+MODES = {
+    "reference": {"parts_executor": "serial"},
+    "threads": {"parts_executor": "threads"},
+    "processes": {"parts_executor": "processes"},
+    "parallel": {"n_workers": 4},
+}
+
+
+def main(
+        input_parsed: InputData,
+        *,
+        parts_executor: PartsExecutor = "serial",
+        n_workers: int | None = 1,
+        backend: ParallelBackend | None = None,
+) -> Answers:
+    parallel_kwargs = {"n_workers": n_workers, "backend": backend}
+    results = run_parts([
+        Part("part1", functools.partial(solvable_sum, input_parsed, use_concat=False, **parallel_kwargs)),
+        Part("part2", functools.partial(solvable_sum, input_parsed, use_concat=True, **parallel_kwargs)),
+    ], executor=parts_executor)
+    solvable_sum1 = results["part1"]
     print(f"{solvable_sum1 = }")
-    # part 2
-    solvable_sum2 = sum(
-        target
-        for target, operands in input_parsed
-        if Solver(target, use_concat=True).is_equality_possible(operands)
-    )
+    solvable_sum2 = results["part2"]
     print(f"{solvable_sum2 = }")
+    return Answers(solvable_sum1, solvable_sum2)
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--parts", choices=PARTS_EXECUTORS, default="serial", help="how to run the two parts")
+    arg_parser.add_argument("--workers", type=int, default=1, help="workers splitting the equations of each part")
+    arg_parser.add_argument("--backend", choices=PARALLEL_BACKENDS, help="default: threads if the GIL is off, else processes")
+    args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input())
+        main(get_parsed_input(), parts_executor=args.parts, n_workers=args.workers, backend=args.backend)
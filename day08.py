@@ -1,9 +1,10 @@
+import functools
 import itertools
 from collections import defaultdict
 
 import numpy as np
 
-from advent_utils import Loc, read_input, timer
+from advent_utils import PARTS_EXECUTORS, Answers, Loc, Part, PartsExecutor, group_symbol_locs, parse_grid, read_input_bytes, run_parts, timer
 
 InputData = tuple[dict[str, set[Loc]], tuple[int, int]]
 
@@ -11,19 +12,8 @@ EMTPY = "."
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(8)
-    grid = np.array([
-        list(line.strip())
-        for line in input_raw.strip().splitlines()
-    ])
-    input_parsed = defaultdict(set)
-    for i in range(grid.shape[0]):
-        for j in range(grid.shape[1]):
-            loc = Loc(i, j)
-            symbol = grid[loc]
-            if symbol != EMTPY:
-                input_parsed[symbol].add(loc)
-    return input_parsed, grid.shape
+    grid = parse_grid(read_input_bytes(8))
+    return group_symbol_locs(grid, ignore=EMTPY), grid.shape
 
 
 class Solver:
@@ -68,14 +58,30 @@ class Solver:
         return all_antinodes
 
 
-def main(input_parsed: InputData):
+MODES = {
+    "reference": {"parts_executor": "serial"},
+    "threads": {"parts_executor": "threads"},
+    "processes": {"parts_executor": "processes"},
+}
+
+
+def main(input_parsed: InputData, *, parts_executor: PartsExecutor = "serial") -> Answers:
     all_antenna_locs, (n_rows, n_cols) = input_parsed
-    all_antinodes1 = Solver(n_rows, n_cols, any_distance=False).solve(all_antenna_locs)
+    results = run_parts([
+        Part("part1", functools.partial(Solver(n_rows, n_cols, any_distance=False).solve, all_antenna_locs)),
+        Part("part2", functools.partial(Solver(n_rows, n_cols, any_distance=True).solve, all_antenna_locs)),
+    ], executor=parts_executor)
+    all_antinodes1 = results["part1"]
     print(f"{len(all_antinodes1) = }")
-    all_antinodes2 = Solver(n_rows, n_cols, any_distance=True).solve(all_antenna_locs)
+    all_antinodes2 = results["part2"]
     print(f"{len(all_antinodes2) = }")
+    return Answers(len(all_antinodes1), len(all_antinodes2))
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--parts", choices=PARTS_EXECUTORS, default="serial", help="how to run the two parts")
+    args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input())
+        main(get_parsed_input(), parts_executor=args.parts)
@@ -1,13 +1,17 @@
+import heapq
+
 import numpy as np
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, map_input, timer
 
 InputData = list[int]
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(9)
-    input_parsed = [int(c) for c in input_raw.strip()]
+    with map_input(9) as mapped:
+        chars = np.frombuffer(mapped, dtype=np.uint8)
+        input_parsed = (chars[(chars >= ord("0")) & (chars <= ord("9"))] - ord("0")).tolist()
+        del chars  # release the mapping
     if len(input_parsed) % 2 == 0:
         print("WARNING: input is an even length (disk spec ends with a gap)")
     return input_parsed
@@ -92,6 +96,39 @@ def compact_disk2(disk: np.ndarray, *, highest_file_id: int):
                 break
 
 
+def checksum_compacted2(disk_spec: InputData) -> int:
+    """
+    the same answer as `compact_disk2` then `get_checksum`, without building the disk:
+    free spans are kept in one min-heap (by position) per span length, so finding the leftmost span
+    that fits a file takes a look at the top of at most 9 heaps instead of a scan from the start of the disk
+    """
+    files: list[tuple[int, int]] = []  # (start, size), indexed by file ID
+    free_spans_by_len: list[list[int]] = [[] for _ in range(10)]  # starts of free spans, indexed by span length
+    position = 0
+    for i, block_count in enumerate(disk_spec):
+        if i % 2 == 0:  # file
+            files.append((position, block_count))
+        elif block_count > 0:  # space
+            free_spans_by_len[block_count].append(position)  # ascending, so already a heap
+        position += block_count
+    checksum = 0
+    for file_id in range(len(files) - 1, -1, -1):
+        file_start, file_size = files[file_id]
+        best_len, best_start = None, file_start
+        for span_len in range(file_size, 10):
+            free_spans = free_spans_by_len[span_len]
+            if len(free_spans) > 0 and free_spans[0] < best_start:
+                best_len, best_start = span_len, free_spans[0]
+        if best_len is not None:
+            heapq.heappop(free_spans_by_len[best_len])
+            if (remaining_len := best_len - file_size) > 0:
+                heapq.heappush(free_spans_by_len[remaining_len], best_start + file_size)
+            file_start = best_start
+        # the space a file moves out of is never used again: files only move left, and later files sit left of it
+        checksum += file_id * (file_size * file_start + file_size * (file_size - 1) // 2)
+    return checksum
+
+
 def get_checksum(disk: np.ndarray) -> int:
     if len(disk.shape) != 1:
         raise ValueError("disk must be a 1-dimensional array")
@@ -102,7 +139,13 @@ def get_checksum(disk: np.ndarray) -> int:
     )
 
 
-def main(input_parsed: InputData):
+MODES = {
+    "reference": {"fast": False},
+    "fast": {"fast": True},
+}
+
+
+def main(input_parsed: InputData, *, fast: bool = False) -> Answers:
     disk = disk_spec_to_disk(input_parsed)
     # part 1
     disk1 = disk.copy()
@@ -110,10 +153,14 @@ def main(input_parsed: InputData):
     checksum1 = get_checksum(disk1)
     print(f"{checksum1 = }")
     # part 2
-    disk2 = disk.copy()
-    compact_disk2(disk2, highest_file_id=(len(input_parsed) // 2))  # in-place
-    checksum2 = get_checksum(disk2)
+    if fast:
+        checksum2 = checksum_compacted2(input_parsed)
+    else:
+        disk2 = disk.copy()
+        compact_disk2(disk2, highest_file_id=(len(input_parsed) // 2))  # in-place
+        checksum2 = get_checksum(disk2)
     print(f"{checksum2 = }")
+    return Answers(checksum1, checksum2)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 import numpy as np
 
-from advent_utils import GridCardinalDirection, GridSolver, Loc, read_input, timer
+from advent_utils import Answers, BitSet, GridCardinalDirection, GridSolver, parse_grid, read_input_bytes, timer
 
 InputData = np.ndarray
 
@@ -9,26 +9,33 @@ END_ELEVATION = 9
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(10)
-    input_parsed = np.array([
-        list(map(int, line.strip()))
-        for line in input_raw.strip().splitlines()
-    ])
-    return input_parsed
+    return parse_grid(read_input_bytes(10)) - ord("0")
+
+
+OFF_GRID = -1  # sentinel around the grid; never the next elevation
 
 
 class Solver(GridSolver):
-    def _find_trails_recursive(self, loc: Loc) -> tuple[set[Loc], int]:
-        current_elevation = self.grid[loc]
+    def __init__(self, grid: np.ndarray):
+        super().__init__(grid)
+        # the search works on flat cell indices
+        self._elevations: list[int] = self.grid.reshape(-1).tolist()
+        self._neighbors: list[list[int]] = self.neighbor_table().tolist()
+        # the padded versions work on flat cell indices of the padded grid, so stepping off the grid needs no check
+        self.padded_grid = self.padded(OFF_GRID)
+        self._padded_elevations: list[int] = self.padded_grid.grid.reshape(-1).tolist()
+        self._offsets = self.padded_grid.flat_offsets(GridCardinalDirection.values())
+
+    def _find_trails_recursive(self, index: int) -> tuple[set[int], int]:
+        current_elevation = self._elevations[index]
         if current_elevation == END_ELEVATION:
-            return {loc}, 1
+            return {index}, 1
         trail_ends = set()
         n_paths = 0
         next_elevation = current_elevation + 1
-        for direction in GridCardinalDirection.values():
-            next_loc = loc.shift(direction)
-            if self.is_loc_in_bounds(next_loc) and self.grid[next_loc] == next_elevation:
-                new_trail_ends, n_paths_new = self._find_trails_recursive(next_loc)
+        for next_index in self._neighbors[index]:
+            if next_index >= 0 and self._elevations[next_index] == next_elevation:
+                new_trail_ends, n_paths_new = self._find_trails_recursive(next_index)
                 trail_ends.update(new_trail_ends)
                 n_paths += n_paths_new
         return trail_ends, n_paths
@@ -36,20 +43,81 @@ class Solver(GridSolver):
     def solve(self) -> tuple[int, int]:
         trailhead_sum1 = 0
         trailhead_sum2 = 0
-        for i in range(self.n_rows):
-            for j in range(self.n_cols):
-                loc = Loc(i, j)
-                if self.grid[loc] == START_ELEVATION:
-                    trail_ends, n_paths = self._find_trails_recursive(loc)
-                    trailhead_sum1 += len(trail_ends)
-                    trailhead_sum2 += n_paths
+        for index in np.flatnonzero(self.grid == START_ELEVATION).tolist():
+            trail_ends, n_paths = self._find_trails_recursive(index)
+            trailhead_sum1 += len(trail_ends)
+            trailhead_sum2 += n_paths
         return trailhead_sum1, trailhead_sum2
 
+    def _find_trails_recursive_padded(self, index: int) -> tuple[set[int], int]:
+        current_elevation = self._padded_elevations[index]
+        if current_elevation == END_ELEVATION:
+            return {index}, 1
+        trail_ends = set()
+        n_paths = 0
+        next_elevation = current_elevation + 1
+        for offset in self._offsets:
+            if self._padded_elevations[next_index := index + offset] == next_elevation:
+                new_trail_ends, n_paths_new = self._find_trails_recursive_padded(next_index)
+                trail_ends.update(new_trail_ends)
+                n_paths += n_paths_new
+        return trail_ends, n_paths
+
+    def solve_padded(self) -> tuple[int, int]:
+        """the same search as `solve`, on the padded grid: the border stops it instead of the -1 neighbors"""
+        trailhead_sum1 = 0
+        trailhead_sum2 = 0
+        for index in np.flatnonzero(self.padded_grid.grid == START_ELEVATION).tolist():
+            trail_ends, n_paths = self._find_trails_recursive_padded(index)
+            trailhead_sum1 += len(trail_ends)
+            trailhead_sum2 += n_paths
+        return trailhead_sum1, trailhead_sum2
+
+    def solve_bitsets(self) -> tuple[int, int]:
+        """
+        the same answers as `solve`, without a search from each trailhead: working down from the peaks one elevation
+        at a time, a cell's reachable peaks are the union of those of its neighbors one step up (as bitsets of
+        cell indices), and its number of paths is their sum
+        """
+        reachable_ends: dict[int, BitSet] = {}
+        n_paths: dict[int, int] = {}
+        for index in np.flatnonzero(self.padded_grid.grid == END_ELEVATION).tolist():
+            reachable_ends[index] = BitSet((index,))
+            n_paths[index] = 1
+        for elevation in range(END_ELEVATION - 1, START_ELEVATION - 1, -1):
+            for index in np.flatnonzero(self.padded_grid.grid == elevation).tolist():
+                ends = BitSet()
+                n = 0
+                for offset in self._offsets:
+                    if self._padded_elevations[next_index := index + offset] == elevation + 1:
+                        ends |= reachable_ends[next_index]
+                        n += n_paths[next_index]
+                reachable_ends[index] = ends
+                n_paths[index] = n
+        trailheads = np.flatnonzero(self.padded_grid.grid == START_ELEVATION).tolist()
+        trailhead_sum1 = sum(len(reachable_ends[index]) for index in trailheads)
+        trailhead_sum2 = sum(n_paths[index] for index in trailheads)
+        return trailhead_sum1, trailhead_sum2
+
+
+MODES = {
+    "reference": {"use_padding": False, "use_bitsets": False},
+    "padded": {"use_padding": True, "use_bitsets": False},
+    "bitsets": {"use_bitsets": True},
+}
+
 
-def main(input_parsed: InputData):
-    trailhead_sum1, trailhead_sum2 = Solver(input_parsed).solve()
+def main(input_parsed: InputData, *, use_padding: bool = False, use_bitsets: bool = False) -> Answers:
+    solver = Solver(input_parsed)
+    if use_bitsets:
+        trailhead_sum1, trailhead_sum2 = solver.solve_bitsets()
+    elif use_padding:
+        trailhead_sum1, trailhead_sum2 = solver.solve_padded()
+    else:
+        trailhead_sum1, trailhead_sum2 = solver.solve()
     print(f"{trailhead_sum1 = }")
     print(f"{trailhead_sum2 = }")
+    return Answers(trailhead_sum1, trailhead_sum2)
 
 
 if __name__ == "__main__":
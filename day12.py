@@ -1,20 +1,16 @@
 import dataclasses
+from collections import defaultdict
 from typing import NamedTuple
 
 import numpy as np
 
-from advent_utils import Direction, GridCardinalDirection, GridSolver, Loc, read_input, timer
+from advent_utils import Answers, Direction, DisjointSet, GridCardinalDirection, GridSolver, Loc, grid_edges, parse_grid, read_input_bytes, timer
 
 InputData = np.ndarray
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(12)
-    grid = np.array([
-        list(line.strip())
-        for line in input_raw.strip().splitlines()
-    ])
-    return grid
+    return parse_grid(read_input_bytes(12))
 
 
 class Fence(NamedTuple):
@@ -52,6 +48,9 @@ class Region:
         return len(self.area) * n_sides
 
 
+OUTSIDE = 0  # sentinel around the grid; never a plant's symbol
+
+
 class RegionFinder(GridSolver):
     def find_regions(self) -> list[Region]:
         to_return = []
@@ -85,13 +84,45 @@ class RegionFinder(GridSolver):
                 all_searched_locs.update(area)
         return to_return
 
-
-def main(input_parsed: InputData):
-    regions = RegionFinder(input_parsed).find_regions()
+    def find_regions_union_find(self) -> list[Region]:
+        """
+        the same regions as `find_regions`, without a flood fill: plots are labelled by merging every pair of
+        same-plant neighbors at once, and the fences come from comparing the padded grid with itself shifted
+        """
+        plots = DisjointSet(self.n_cells)
+        plots.union_many(*grid_edges(self.grid))
+        labels: list[int] = plots.labels().tolist()
+        areas: dict[int, set[Loc]] = defaultdict(set)
+        perimeters: dict[int, set[Fence]] = defaultdict(set)
+        for index, label in enumerate(labels):
+            areas[label].add(self.index_to_loc(index))
+        # a fence goes wherever the neighbor differs, which (thanks to the sentinel) includes everywhere off the grid
+        padded_grid = self.padded(OUTSIDE)
+        here = padded_grid.grid[padded_grid.original_slices()]
+        for direction in GridCardinalDirection.values():
+            there = padded_grid.grid[
+                (padded_grid.width + direction.row_shift):(padded_grid.width + direction.row_shift + self.n_rows),
+                (padded_grid.width + direction.col_shift):(padded_grid.width + direction.col_shift + self.n_cols),
+            ]
+            for index in np.flatnonzero(here != there).tolist():
+                perimeters[labels[index]].add(Fence(self.index_to_loc(index), direction))
+        return [Region(area, perimeters[label]) for label, area in areas.items()]
+
+
+MODES = {
+    "reference": {"use_union_find": False},
+    "union_find": {"use_union_find": True},
+}
+
+
+def main(input_parsed: InputData, *, use_union_find: bool = True) -> Answers:
+    region_finder = RegionFinder(input_parsed)
+    regions = region_finder.find_regions_union_find() if use_union_find else region_finder.find_regions()
     cost1 = sum(region.get_region_cost(bulk_discount=False) for region in regions)
     print(f"{cost1 = }")
     cost2 = sum(region.get_region_cost(bulk_discount=True) for region in regions)
     print(f"{cost2 = }")
+    return Answers(cost1, cost2)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,10 @@
+import functools
 import math
 import re
 
 import numpy as np
 
-from advent_utils import read_input, timer
+from advent_utils import PARTS_EXECUTORS, Answers, Part, PartsExecutor, read_input, run_parts, timer
 
 InputData = list[tuple[np.ndarray, np.ndarray]]
 
@@ -64,7 +65,12 @@ def mat_solve_ints(mat: np.ndarray) -> tuple[int, int]:
     return a_count, b_count
 
 
-def solve(input_parsed: InputData, *, button_press_limit: int | None = None, vec_shift: int = 0):
+def solve(input_parsed: InputData, *, button_press_limit: int | None = None, vec_shift: int = 0) -> tuple[int, list[str]]:
+    """
+    the total cost, and the notes to print about the machines;
+    nothing is printed or changed in place here, so both parts can run on the same input at once
+    """
+    notes = []
     total_cost = 0
     n_not_solvable = 0
     for i, (mat, vec) in enumerate(input_parsed, start=1):
@@ -74,8 +80,8 @@ def solve(input_parsed: InputData, *, button_press_limit: int | None = None, vec
         a_vec = mat[:, 0]
         b_vec = mat[:, 1]
         if are_collinear(a_vec, b_vec):
-            print(f"WARNING: COLLINEAR ({i})")
-        vec += vec_shift
+            notes.append(f"WARNING: COLLINEAR ({i})")
+        vec = vec + vec_shift
         mat_equation = np.concat([mat, np.expand_dims(vec, axis=1)], axis=1)
         try:
             button_counts = mat_solve_ints(mat_equation)
@@ -83,24 +89,42 @@ def solve(input_parsed: InputData, *, button_press_limit: int | None = None, vec
             n_not_solvable += 1
             continue  # not solvable
         if button_press_limit is not None and any(count > button_press_limit for count in button_counts):
-            print(f"WARNING: button press count over limit ({i})")
+            notes.append(f"WARNING: button press count over limit ({i})")
             continue
         this_cost = np.dot(button_counts, COST_VEC).item()
         total_cost += this_cost
-    print(f"({n_not_solvable} of {len(input_parsed)} not solvable)")
-    return total_cost
+    notes.append(f"({n_not_solvable} of {len(input_parsed)} not solvable)")
+    return total_cost, notes
 
 
-def main(input_parsed: InputData):
+MODES = {
+    "reference": {"parts_executor": "serial"},
+    "threads": {"parts_executor": "threads"},
+    "processes": {"parts_executor": "processes"},
+}
+
+
+def main(input_parsed: InputData, *, parts_executor: PartsExecutor = "serial") -> Answers:
+    results = run_parts([
+        Part("part1", functools.partial(solve, input_parsed, button_press_limit=100)),
+        Part("part2", functools.partial(solve, input_parsed, vec_shift=10000000000000)),
+    ], executor=parts_executor)
     # part 1
-    total_cost1 = solve(input_parsed, button_press_limit=100)
+    total_cost1, notes1 = results["part1"]
+    print("\n".join(notes1))
     print(f"{total_cost1 = }")
     # part 2
     print("-" * 32)
-    total_cost2 = solve(input_parsed, vec_shift=10000000000000)
+    total_cost2, notes2 = results["part2"]
+    print("\n".join(notes2))
     print(f"{total_cost2 = }")
+    return Answers(total_cost1, total_cost2)
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--parts", choices=PARTS_EXECUTORS, default="serial", help="how to run the two parts")
+    args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input())
+        main(get_parsed_input(), parts_executor=args.parts)
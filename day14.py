@@ -5,15 +5,19 @@ from collections import defaultdict
 from pathlib import Path
 
 import numpy as np
-from PIL import Image
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, Cycle, array_fingerprint, find_cycle, lazy_import, read_input, span, timer
+
+Image = lazy_import("PIL.Image")
 
 InputData = np.ndarray
 
 RENDERINGS_DIR = Path("data/day14-renderings")
-shutil.rmtree(RENDERINGS_DIR, ignore_errors=True)
-RENDERINGS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def reset_renderings_dir():
+    shutil.rmtree(RENDERINGS_DIR, ignore_errors=True)
+    RENDERINGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def get_parsed_input() -> InputData:
@@ -37,20 +41,31 @@ class Solver:
             raise ValueError("bots array must be of shape (n, 4)")
         self.bot_locs = bots_data[:, :2]
         self.bot_directions = bots_data[:, 2:]
-        self._state_history: set[str] = set()
+        self._initial_bot_locs = self.bot_locs.copy()
+        self._position_mod = np.array([self.n_rows, self.n_cols])
+        self._cycle: Cycle | None = None  # only searched for by an unbounded `simulate`
         self._found_loop = False
         self.seconds_elapsed = 0
+        RENDERINGS_DIR.mkdir(parents=True, exist_ok=True)
         self.save_rendering()
 
     def save_rendering(self):
-        canvas = np.zeros((self.n_rows, self.n_cols), dtype=bool)
-        for bot_loc in self.bot_locs:
-            canvas[*bot_loc] = True
-        image = Image.fromarray(canvas.transpose())
-        image.save(RENDERINGS_DIR / f"{self.seconds_elapsed:09d}-seconds.png")
-
-    def get_state_str(self) -> str:
-        return "\n".join(" ".join(map(str, bot_loc)) for bot_loc in self.bot_locs)
+        with span("save rendering"):
+            canvas = np.zeros((self.n_rows, self.n_cols), dtype=bool)
+            for bot_loc in self.bot_locs:
+                canvas[*bot_loc] = True
+            image = Image.fromarray(canvas.transpose())
+            image.save(RENDERINGS_DIR / f"{self.seconds_elapsed:09d}-seconds.png")
+
+    def next_bot_locs(self, bot_locs: np.ndarray) -> np.ndarray:
+        return (bot_locs + self.bot_directions) % self._position_mod
+
+    def get_cycle(self) -> Cycle:
+        """when the formations start repeating, found without keeping every formation so far"""
+        if self._cycle is None:
+            with span("find cycle"):
+                self._cycle = find_cycle(self._initial_bot_locs, self.next_bot_locs, fingerprint=array_fingerprint)
+        return self._cycle
 
     def simulate(self, n_seconds_stop: int | None):
         if self._found_loop:
@@ -61,21 +76,24 @@ class Solver:
                 return
             elif n_seconds_stop < self.seconds_elapsed:
                 raise ValueError("simulation has already run past that point; use a new Solver instance")
-        position_mod = np.array([self.n_rows, self.n_cols])
+        # where the formations start repeating, if it's needed (or already known); a bounded run short of it just steps
+        repeat_seconds = None
+        if n_seconds_stop is None:
+            cycle = self.get_cycle()
+            repeat_seconds = cycle.start + cycle.period
+        elif self._cycle is not None and n_seconds_stop >= self._cycle.start + self._cycle.period:
+            repeat_seconds = self._cycle.start + self._cycle.period
         while n_seconds_stop is None or self.seconds_elapsed < n_seconds_stop:
+            if repeat_seconds is not None and self.seconds_elapsed >= repeat_seconds:  # nothing new from here on
+                self._found_loop = True
+                print(f"after {repeat_seconds} seconds, the bots are back in their formation from {self._cycle.start} seconds")
+                return
             # progress forward 1 second
             self.bot_locs += self.bot_directions
-            self.bot_locs %= position_mod
+            self.bot_locs %= self._position_mod
             self.seconds_elapsed += 1
-            # check if we're in a loop
-            state_str = self.get_state_str()
-            if state_str in self._state_history:  # seen this state before!
-                self._found_loop = True
-                print(f"after {self.seconds_elapsed} iterations, the bots have started repeating formations")
-                return
-            # new state: save it
-            self._state_history.add(state_str)
-            self.save_rendering()
+            if repeat_seconds is None or self.seconds_elapsed < repeat_seconds:
+                self.save_rendering()
 
     def get_score(self) -> int:
         quadrant_line_rows = self.n_rows // 2
@@ -92,14 +110,19 @@ class Solver:
         return functools.reduce(lambda a, b: a * b, quadrant_counts.values(), 1)
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
+    reset_renderings_dir()
     # part 1
-    solver = Solver(101, 103, input_parsed)
-    solver.simulate(n_seconds_stop=100)
-    score = solver.get_score()
+    with span("part1"):
+        solver = Solver(101, 103, input_parsed)
+        solver.simulate(n_seconds_stop=100)
+        score = solver.get_score()
     print(f"{score = }")
     # part 2
-    solver.simulate(n_seconds_stop=None)
+    with span("part2"):
+        solver.simulate(n_seconds_stop=None)
+    # part 2 is found by looking at the renderings
+    return Answers(score, None)
 
 
 if __name__ == "__main__":
@@ -3,14 +3,15 @@ from typing import Any
 
 import numpy as np
 
-from advent_utils import Direction, GridCardinalDirection, GridSolver, Loc, read_input, timer
+from advent_utils import Answers, Direction, GridCardinalDirection, GridSolver, Loc, find_symbol, parse_grid, read_input, timer
 
 InputData = tuple[np.ndarray, list[GridCardinalDirection]]
 
-WALL = "#"
-BOX = "O"
-EMPTY = "."
-BOT = "@"
+# character codes, as held by the grid
+WALL = ord("#")
+BOX = ord("O")
+EMPTY = ord(".")
+BOT = ord("@")
 
 DIRECTIONS = {
     "^": GridCardinalDirection.UP,
@@ -23,7 +24,7 @@ DIRECTIONS = {
 def get_parsed_input() -> InputData:
     input_raw = read_input(15)
     grid_str, directions_str = input_raw.strip().split("\n\n")
-    grid = np.array([list(line) for line in grid_str.strip().splitlines()])
+    grid = parse_grid(grid_str)
     directions = [
         direction
         for char in directions_str
@@ -37,14 +38,7 @@ class _Solver(GridSolver):
         if {*grid[0, :], *grid[-1, :], *grid[:, 0], *grid[:, -1]} != {WALL}:
             raise ValueError("grid border must be completely walls!")
         super().__init__(grid)
-        self.bot_loc = self._find_bot()
-
-    def _find_bot(self) -> Loc:
-        for i in range(1, self.n_rows - 1):
-            for j in range(1, self.n_cols - 1):
-                if self.grid[i, j] == BOT:
-                    return Loc(i, j)
-        raise ValueError("bot not found!")
+        self.bot_loc = find_symbol(self.grid, BOT)
 
 
 class Solver1(_Solver):
@@ -75,8 +69,8 @@ class Solver1(_Solver):
         return total
 
 
-BOX_LEFT = "["
-BOX_RIGHT = "]"
+BOX_LEFT = ord("[")
+BOX_RIGHT = ord("]")
 
 
 EXPANSIONS = {
@@ -110,9 +104,9 @@ class Solver2(_Solver):
         super().__init__(np.array([
             list(itertools.chain(*(EXPANSIONS[sym] for sym in row)))
             for row in grid
-        ]))
+        ], dtype=np.uint8))
 
-    def _move_helper(self, loc_target: Loc, direction: Direction) -> dict[Loc, str]:
+    def _move_helper(self, loc_target: Loc, direction: Direction) -> dict[Loc, int]:
         this_symbol = self.grid[loc_target]
         if this_symbol == WALL:
             raise CannotMove
@@ -174,7 +168,7 @@ class Solver2(_Solver):
         return total
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     grid, directions = input_parsed
     # part 1
     solver1 = Solver1(grid)
@@ -186,6 +180,7 @@ def main(input_parsed: InputData):
     solver2.move_bot(directions)
     gps_sum2 = solver2.get_gps_sum()
     print(f"{gps_sum2 = }")
+    return Answers(gps_sum1, gps_sum2)
 
 
 if __name__ == "__main__":
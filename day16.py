@@ -1,11 +1,9 @@
-import collections
-import copy
 import itertools
 from typing import NamedTuple
 
 import numpy as np
 
-from advent_utils import Direction, GridCardinalDirection, GridSolver, Loc, read_input, timer
+from advent_utils import Answers, Direction, GridCardinalDirection, GridSolver, Loc, find_symbol, parse_grid, read_input_bytes, shortest_paths, span, timer
 
 InputData = tuple[np.ndarray, Loc, Loc]
 
@@ -24,33 +22,13 @@ class ReindeerState(NamedTuple):
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(16)
-    grid_symbols = np.array([list(line) for line in input_raw.strip().splitlines()])
-    start_loc = None
-    end_loc = None
-    for i in range(grid_symbols.shape[0]):
-        for j in range(grid_symbols.shape[1]):
-            loc = Loc(i, j)
-            symbol = grid_symbols[loc]
-            if symbol == START:
-                start_loc = loc
-            elif symbol == END:
-                end_loc = loc
-    if start_loc is None or end_loc is None:
-        raise ValueError("Failed to find start or end location")
-    grid = np.array([[sym != WALL for sym in row] for row in grid_symbols])
+    grid_symbols = parse_grid(read_input_bytes(16))
+    start_loc = find_symbol(grid_symbols, START)
+    end_loc = find_symbol(grid_symbols, END)
+    grid = grid_symbols != ord(WALL)
     return grid, start_loc, end_loc
 
 
-def get_move_options(current_cost: int, state: ReindeerState) -> list[tuple[int, ReindeerState]]:
-    loc, direction = state
-    return [
-        (current_cost + COST_MOVE, ReindeerState(loc.shift(direction), direction)),
-        (current_cost + COST_ROTATE, ReindeerState(loc, direction.rot_clockwise())),
-        (current_cost + COST_ROTATE, ReindeerState(loc, direction.rot_counter_clockwise())),
-    ]
-
-
 class Solver(GridSolver):
     def __init__(self, grid: np.ndarray, start_loc: Loc, end_loc: Loc):
         if any(itertools.chain(grid[0, :], grid[-1, :], grid[:, 0], grid[:, -1])):
@@ -61,57 +39,38 @@ class Solver(GridSolver):
         self.start_state = ReindeerState(start_loc, GridCardinalDirection.RIGHT.value)
         self.end_loc = end_loc
 
+    def get_move_options(self, state: ReindeerState) -> list[tuple[ReindeerState, int]]:
+        loc, direction = state
+        options = [
+            (ReindeerState(loc, direction.rot_clockwise()), COST_ROTATE),
+            (ReindeerState(loc, direction.rot_counter_clockwise()), COST_ROTATE),
+        ]
+        loc_next = loc.shift(direction)
+        if self.grid[loc_next]:  # no bounds check needed, since the edges are all walls
+            options.append((ReindeerState(loc_next, direction), COST_MOVE))
+        return options
+
     def find_best_paths(self) -> tuple[int, set[Loc]]:
-        lowest_cost: int | None = None
-        locs_on_any_best_path = set()
-
-        cache: dict[ReindeerState, tuple[int, set[Loc]]] = {}
-        search_queue = collections.deque([(0, self.start_state, {self.start_state.loc})])
-        while len(search_queue) > 0:
-            cost, state, locs_visited = search_queue.popleft()
-
-            # if the current cost is higher than our best full solution so far, following this path further is pointless
-            if lowest_cost is not None and cost > lowest_cost:
-                continue
-
-            if state.loc == self.end_loc:  # found a way to the end!
-                if lowest_cost is None or cost < lowest_cost:  # strictly better than anything we had before; forget previous stuff
-                    lowest_cost = cost
-                    locs_on_any_best_path = copy.copy(locs_visited)
-                elif cost == lowest_cost:  # tied with before; merge data
-                    locs_on_any_best_path |= locs_visited
-                # else: this is no improvement; just keep our previous solution
-                continue  # no need to keep searching past the end
-
-            if not self.grid[state.loc]:  # wall
-                continue
-
-            # is this the cheapest way to get to this state? (that we've seen so far)
-            cost_old, locs_visited_old = cache.get(state, (None, set()))
-            if cost_old is None or cost < cost_old:  # strictly better than anything we had before; forget previous stuff
-                pass
-            elif cost == cost_old:  # tied with before; merge data
-                locs_visited.update(locs_visited_old)
-            else:  # this new way is worse than what we've seen before
-                continue
-            cache[state] = (cost, locs_visited)
-
-            # add adjacent states to the queue to be processed
-            for cost_new, state_new in get_move_options(cost, state):
-                locs_visited_new = locs_visited | {state_new.loc}
-                search_queue.append((cost_new, state_new, locs_visited_new))
-
-        if lowest_cost is None:
+        result = shortest_paths(
+            [self.start_state],
+            self.get_move_options,
+            is_goal=(lambda state: state.loc == self.end_loc),
+            heuristic=(lambda state: state.loc.manhattan_distance(self.end_loc)),  # each move costs at least 1
+        )
+        if result.goal_distance is None:
             raise ValueError("never found path to end loc")
-        return lowest_cost, locs_on_any_best_path
+        locs_on_any_best_path = {state.loc for state in result.states_on_paths(result.goals)}
+        return result.goal_distance, locs_on_any_best_path
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     grid, start_loc, end_loc = input_parsed
     solver = Solver(grid, start_loc, end_loc)
-    min_score, locs_on_best_paths = solver.find_best_paths()
+    with span("find best paths"):  # parts 1 and 2 come out of the same search
+        min_score, locs_on_best_paths = solver.find_best_paths()
     print(f"{min_score = }")
     print(f"{len(locs_on_best_paths) = }")
+    return Answers(min_score, len(locs_on_best_paths))
 
 
 if __name__ == "__main__":
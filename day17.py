@@ -3,7 +3,7 @@ import itertools
 import re
 from typing import Self
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, read_input, timer
 
 InputData = tuple[tuple[int, int, int], list[int]]
 
@@ -156,7 +156,7 @@ def part2(program: list[int], check: bool = True) -> int:
 # run both parts together
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     registers_tup, program = input_parsed
     # part 1
     output = run(registers_tup, program)
@@ -164,6 +164,7 @@ def main(input_parsed: InputData):
     # part 2
     modified_a = part2(program)
     print(f"{modified_a = }")
+    return Answers(",".join(str(o) for o in output), modified_a)
 
 
 if __name__ == "__main__":
@@ -2,16 +2,18 @@ from typing import Iterable
 
 import numpy as np
 
-from advent_utils import GridCardinalDirection, GridSolver, Loc, read_input, timer
+from advent_utils import (
+    Answers, DisjointSet, GridCardinalDirection, GridSolver, Loc, distance_field, grid_edges, iter_input_lines, timer,
+)
 
 InputData = list[Loc]
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(18)
     input_parsed = [
-        Loc(*map(int, reversed(line.strip().split(","))))
-        for line in input_raw.strip().splitlines()
+        Loc(*map(int, reversed(line.strip().split(b","))))
+        for line in iter_input_lines(18)
+        if line.strip()
     ]
     return input_parsed
 
@@ -49,38 +51,93 @@ class Solver(GridSolver):
             to_search = to_search_next
         return None
 
+    def solve_min_distance_field(self) -> int | None:
+        """the same answer as `solve_min_distance`, with `distance_field` expanding each step's frontier as an array"""
+        if self.start_loc == self.end_loc:
+            return 0
+        # the search above reaches the end even when it's corrupted, so it's always open here
+        open_mask = self.grid.copy()
+        open_mask[self.end_loc] = True
+        distances = distance_field(open_mask, [self.start_loc], target=self.end_loc)
+        min_distance = distances[self.end_loc].item()
+        return None if min_distance < 0 else min_distance
 
-def find_first_total_blocker(corruption_order: InputData) -> Loc:
+
+def find_first_total_blocker(corruption_order: InputData, *, use_distance_field: bool = False) -> Loc:
+    solve_min_distance = Solver.solve_min_distance_field if use_distance_field else Solver.solve_min_distance
     lower = 0
     upper = len(corruption_order)
     while (search_width := upper - lower) > 1:
         target = lower + (search_width // 2)
         solver = Solver()
         solver.place_corruptions(corruption_order[:target])
-        if solver.solve_min_distance() is None:  # no path; too high
+        if solve_min_distance(solver) is None:  # no path; too high
             upper = target
         else:  # yes path; too low
             lower = target
 
     final_solver = Solver()
     final_solver.place_corruptions(corruption_order[:lower])
-    if final_solver.solve_min_distance() is None:
+    if solve_min_distance(final_solver) is None:
         raise RuntimeError("algorithm error: supposed answer is not actually the first total blocker")
     final_solver.place_corruption(corruption_order[lower])
-    if final_solver.solve_min_distance() is not None:
+    if solve_min_distance(final_solver) is not None:
         raise ValueError("algorithm error: supposed answer is not actually a total blocker")
     return corruption_order[lower]
 
 
-def main(input_parsed: InputData):
+def find_first_total_blocker_union_find(corruption_order: InputData) -> Loc:
+    """
+    the same answer as `find_first_total_blocker`, in one pass backwards through time:
+    starting with every corruption placed, each one is removed in turn (latest first) and its cell joined to its open
+    neighbors, until the start and end are connected; the corruption removed last is the first total blocker
+    """
+    solver = Solver()
+    first_corrupted = {}  # when each cell gets corrupted (the first time, if repeated)
+    for i, corruption_loc in enumerate(corruption_order):
+        first_corrupted.setdefault(corruption_loc, i)
+    solver.place_corruptions(first_corrupted.keys())
+    open_cells: list[bool] = solver.grid.reshape(-1).tolist()
+    neighbors: list[list[int]] = solver.neighbor_table().tolist()
+    regions = DisjointSet(solver.n_cells)
+    regions.union_many(*grid_edges(solver.grid, mask=solver.grid))
+    start, end = solver.loc_to_index(solver.start_loc), solver.loc_to_index(solver.end_loc)
+    if regions.connected(start, end):
+        raise ValueError("the corruptions never block the path")
+    for i in range(len(corruption_order) - 1, -1, -1):
+        corruption_loc = corruption_order[i]
+        if first_corrupted[corruption_loc] != i:  # the cell stays corrupted by an earlier byte
+            continue
+        index = solver.loc_to_index(corruption_loc)
+        open_cells[index] = True
+        for neighbor in neighbors[index]:
+            if neighbor >= 0 and open_cells[neighbor]:
+                regions.union(index, neighbor)
+        if regions.connected(start, end):
+            return corruption_loc
+    raise RuntimeError("algorithm error: start and end are still separate with no corruptions")
+
+
+MODES = {
+    "reference": {"use_distance_field": False, "use_union_find": False},
+    "distance_field": {"use_distance_field": True, "use_union_find": False},
+    "union_find": {"use_distance_field": True, "use_union_find": True},
+}
+
+
+def main(input_parsed: InputData, *, use_distance_field: bool = True, use_union_find: bool = False) -> Answers:
     # part 1
     solver = Solver()
     solver.place_corruptions(input_parsed[:1024])
-    min_distance = solver.solve_min_distance()
+    min_distance = solver.solve_min_distance_field() if use_distance_field else solver.solve_min_distance()
     print(f"{min_distance = }")
     # part 2
-    corruption_loc  = find_first_total_blocker(input_parsed)
+    if use_union_find:
+        corruption_loc = find_first_total_blocker_union_find(input_parsed)
+    else:
+        corruption_loc  = find_first_total_blocker(input_parsed, use_distance_field=use_distance_field)
     print(f"first totally-blocking corruption: {corruption_loc.col},{corruption_loc.row}")
+    return Answers(min_distance, f"{corruption_loc.col},{corruption_loc.row}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
-from functools import cache
+import functools
 
-from advent_utils import read_input, timer
+from advent_utils import (
+    PARALLEL_BACKENDS, Answers, ParallelBackend, PerWorker, memoize, memoize_method, parallel_map, read_input, timer,
+)
 
 InputData = tuple[set[str], list[str]]
 
@@ -19,7 +21,7 @@ class Solver:
         self.towel_patterns = towel_patterns
         self.towel_pattern_lengths = {len(towel) for towel in towel_patterns}
 
-    @cache
+    @memoize_method(maxsize=(1 << 18))
     def is_target_possible(self, target: str) -> bool:
         target_len = len(target)
         if target_len == 0:
@@ -32,7 +34,7 @@ class Solver:
                 return True
         return False
 
-    @cache
+    @memoize_method(maxsize=(1 << 18))
     def count_combinations(self, target: str) -> int:
         target_len = len(target)
         if target_len == 0:
@@ -47,9 +49,55 @@ class Solver:
         return n_combinations
 
 
-def main(input_parsed: InputData):
+@memoize(maxsize=16)
+def get_solver(towel_patterns: frozenset[str]) -> Solver:
+    """inputs with the same towel patterns share a solver, and so its memo tables"""
+    return Solver(set(towel_patterns))
+
+
+_worker_solvers: PerWorker[dict[frozenset[str], Solver]] = PerWorker(dict)
+MAX_WORKER_SOLVERS = 16
+
+
+def get_worker_solver(towel_patterns: frozenset[str]) -> Solver:
+    """like `get_solver`, but each worker thread keeps its own solvers, since the memo tables aren't safe to share"""
+    solvers = _worker_solvers.get()
+    if (solver := solvers.get(towel_patterns)) is None:
+        if len(solvers) >= MAX_WORKER_SOLVERS:
+            del solvers[next(iter(solvers))]  # the oldest
+        solver = solvers[towel_patterns] = Solver(set(towel_patterns))
+    return solver
+
+
+def cache_clear():
+    """for timing harnesses, so each run starts cold (see `runner.clear_caches`)"""
+    get_solver.cache_clear()
+    _worker_solvers.clear()
+
+
+def solve_target(towel_patterns: frozenset[str], target: str) -> tuple[bool, int]:
+    solver = get_worker_solver(towel_patterns)
+    return solver.is_target_possible(target), solver.count_combinations(target)
+
+
+MODES = {
+    "reference": {"n_workers": 1},
+    "parallel": {"n_workers": 4},
+}
+
+
+def main(input_parsed: InputData, *, n_workers: int | None = 1, backend: ParallelBackend | None = None) -> Answers:
     towel_patterns, targets = input_parsed
-    solver = Solver(towel_patterns)
+    if n_workers != 1:
+        target_results = parallel_map(
+            functools.partial(solve_target, frozenset(towel_patterns)), targets, n_workers=n_workers, backend=backend,
+        )
+        n_possible = sum(is_possible for is_possible, _ in target_results)
+        print(f"{n_possible = }")
+        n_combinations = sum(n for _, n in target_results)
+        print(f"{n_combinations = }")
+        return Answers(n_possible, n_combinations)
+    solver = get_solver(frozenset(towel_patterns))
     # part 1
     n_possible = sum(
         solver.is_target_possible(target)
@@ -62,8 +110,14 @@ def main(input_parsed: InputData):
         for target in targets
     )
     print(f"{n_combinations = }")
+    return Answers(n_possible, n_combinations)
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--workers", type=int, default=1, help="workers splitting the designs (default: 1)")
+    arg_parser.add_argument("--backend", choices=PARALLEL_BACKENDS, help="default: threads if the GIL is off, else processes")
+    args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input())
+        main(get_parsed_input(), n_workers=args.workers, backend=args.backend)
@@ -1,9 +1,14 @@
+import functools
 import itertools
 
 import numpy as np
-from tqdm import tqdm
 
-from advent_utils import GridCardinalDirection, GridSolver, Loc, read_input, timer
+from advent_utils import (
+    PARTS_EXECUTORS, Answers, Direction, GridSolver, Loc, LocPacker, Part, PartsExecutor, find_symbol, lazy_import, parse_grid,
+    read_input_bytes, run_parts, span, timer,
+)
+
+tqdm = lazy_import("tqdm")
 
 InputData = tuple[np.ndarray, Loc, Loc]
 
@@ -14,21 +19,10 @@ END = "E"
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(20)
-    grid_symbols = np.array([list(line) for line in input_raw.strip().splitlines()])
-    start_loc = None
-    end_loc = None
-    for i in range(grid_symbols.shape[0]):
-        for j in range(grid_symbols.shape[1]):
-            loc = Loc(i, j)
-            symbol = grid_symbols[loc]
-            if symbol == START:
-                start_loc = loc
-            elif symbol == END:
-                end_loc = loc
-    if start_loc is None or end_loc is None:
-        raise ValueError("Failed to find start or end location")
-    grid = np.array([[sym != WALL for sym in row] for row in grid_symbols])
+    grid_symbols = parse_grid(read_input_bytes(20))
+    start_loc = find_symbol(grid_symbols, START)
+    end_loc = find_symbol(grid_symbols, END)
+    grid = grid_symbols != ord(WALL)
     return grid, start_loc, end_loc
 
 
@@ -43,62 +37,78 @@ class Solver(GridSolver):
         self.end_loc = end_loc
 
     def get_full_path(self) -> list[Loc]:
-        path = [self.start_loc]
-        loc = self.start_loc
-        while loc != self.end_loc:
-            possible_moves = set()
-            for direction in GridCardinalDirection.values():
-                next_loc = loc.shift(direction)
-                if self.grid[next_loc] and next_loc not in path[-2:]:
-                    possible_moves.add(next_loc)
+        neighbors = self.neighbor_table(open_mask=self.grid).tolist()
+        end_index = self.loc_to_index(self.end_loc)
+        index = self.loc_to_index(self.start_loc)
+        previous_index = -1
+        path = [index]
+        while index != end_index:
+            possible_moves = [
+                next_index
+                for next_index in neighbors[index]
+                if next_index >= 0 and next_index != previous_index
+            ]
             if len(possible_moves) != 1:
-                raise RuntimeError(f"number of possible moves from {loc} is not exactly 1")
-            loc = next(iter(possible_moves))
-            path.append(loc)
-        return path
+                raise RuntimeError(f"number of possible moves from {self.index_to_loc(index)} is not exactly 1")
+            previous_index, index = index, possible_moves[0]
+            path.append(index)
+        return [self.index_to_loc(index) for index in path]
 
     def count_cheats(self, full_path: list[Loc], *, cheat_length: int, threshold: int = 100) -> int:
-        full_path_lookup = {loc: i for i, loc in enumerate(full_path)}
+        # a cheat can end up to `cheat_length` columns past either edge of the grid, so leave that much margin
+        packer = LocPacker(self.n_cols, margin=cheat_length)
+        path_codes = [packer.pack(loc) for loc in full_path]
+        full_path_lookup = {code: i for i, code in enumerate(path_codes)}
+        # gather the neighborhood of all nearby points, as offsets relative to wherever the cheat starts
+        with span("build neighborhood"):
+            neighborhood = [
+                (packer.offset(Direction(row_shift, col_shift)), abs(row_shift) + abs(col_shift))
+                for row_shift in range(-cheat_length, cheat_length + 1)
+                for col_shift in range(abs(row_shift) - cheat_length, cheat_length - abs(row_shift) + 1)
+                if (row_shift, col_shift) != (0, 0)
+            ]
         n_cheats_over_threshold = 0
-        for i, loc in enumerate(tqdm(full_path[:-4])):  # no point searching for cheats from the last 4 spots
-            # gather neighborhood of all nearby points
-            neighborhood = {loc}
-            to_search = {loc}
-            for _ in range(cheat_length):
-                to_search_next = set()
-                for loc_to_search in to_search:
-                    for direction in GridCardinalDirection.values():
-                        loc_next = loc_to_search.shift(direction)
-                        if loc_next not in neighborhood and self.is_loc_in_bounds(loc_next):
-                            to_search_next.add(loc_next)
-                neighborhood.update(to_search_next)
-                to_search = to_search_next
-            neighborhood.discard(loc)
-            # check if any are on the path and constitute a worthy shortcut
-            for loc_nearby in neighborhood:
-                try:
-                    i_nearby = full_path_lookup[loc_nearby]
-                except KeyError:  # not on path
-                    continue
-                normal_distance = i_nearby - i
-                shortcut_length = loc.manhattan_distance(loc_nearby)
-                time_gained = normal_distance - shortcut_length
-                if time_gained >= threshold:
-                    n_cheats_over_threshold += 1
+        with span("check shortcuts"):
+            for i, code in enumerate(tqdm.tqdm(path_codes[:-4])):  # no point searching for cheats from the last 4 spots
+                # check if any are on the path and constitute a worthy shortcut
+                for offset, shortcut_length in neighborhood:
+                    i_nearby = full_path_lookup.get(code + offset)
+                    if i_nearby is None:  # not on path
+                        continue
+                    normal_distance = i_nearby - i
+                    time_gained = normal_distance - shortcut_length
+                    if time_gained >= threshold:
+                        n_cheats_over_threshold += 1
         return n_cheats_over_threshold
 
 
-def main(input_parsed: InputData):
+MODES = {
+    "reference": {"parts_executor": "serial"},
+    "threads": {"parts_executor": "threads"},
+    "processes": {"parts_executor": "processes"},
+}
+
+
+def main(input_parsed: InputData, *, parts_executor: PartsExecutor = "serial") -> Answers:
     grid, start_loc, end_loc = input_parsed
     solver = Solver(grid, start_loc, end_loc)
-    full_path = solver.get_full_path()
-    print(f"length of full path: {len(full_path)}")
-    n_cheats1 = solver.count_cheats(full_path, cheat_length=2)
+    results = run_parts([
+        Part("full path", solver.get_full_path),
+        Part("part1", functools.partial(solver.count_cheats, cheat_length=2), after=("full path",)),
+        Part("part2", functools.partial(solver.count_cheats, cheat_length=20), after=("full path",)),
+    ], executor=parts_executor)
+    print(f"length of full path: {len(results['full path'])}")
+    n_cheats1 = results["part1"]
     print(f"{n_cheats1 = }")
-    n_cheats2 = solver.count_cheats(full_path, cheat_length=20)
+    n_cheats2 = results["part2"]
     print(f"{n_cheats2 = }")
+    return Answers(n_cheats1, n_cheats2)
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--parts", choices=PARTS_EXECUTORS, default="serial", help="how to run the two parts")
+    args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input())
+        main(get_parsed_input(), parts_executor=args.parts)
@@ -1,11 +1,13 @@
+import functools
 import itertools
 import re
-from functools import cache
 from typing import Literal, cast
 
 import numpy as np
 
-from advent_utils import GridCardinalDirection, Loc, read_input, timer
+from advent_utils import (
+    PARTS_EXECUTORS, Answers, GridCardinalDirection, Loc, Part, PartsExecutor, memoize, memoize_method, read_input, run_parts, timer,
+)
 
 InputData = list[str]
 ACCEPT: Literal["A"] = "A"
@@ -141,7 +143,7 @@ class RobotSystem:
         self.pathfinders = [PATHFINDER_NUMERIC] + ([PATHFINDER_DIRECTIONAL] * (n_robots - 1))
         self.n_layers = len(self.pathfinders)
 
-    @cache
+    @memoize_method(maxsize=(1 << 18))
     def _min_steps_recursive(self, layer: int, segment: tuple[KeypadSymbol, ...]) -> int:
         if layer == self.n_layers:
             return len(segment)
@@ -160,9 +162,20 @@ class RobotSystem:
         return self._min_steps_recursive(0, code)
 
 
+@memoize(maxsize=16)
+def get_robot_system(n_robots: int) -> RobotSystem:
+    """the keypads never change, so one system per chain length keeps its memo table across inputs"""
+    return RobotSystem(n_robots=n_robots)
+
+
+def cache_clear():
+    """for timing harnesses, so each run starts cold (see `runner.clear_caches`)"""
+    get_robot_system.cache_clear()
+
+
 def solve(codes: InputData, *, n_robots: int) -> int:
     total = 0
-    robots = RobotSystem(n_robots=n_robots)
+    robots = get_robot_system(n_robots)
     for code in codes:
         min_presses = robots.min_steps_to_enter_code(tuple(code))
         code_num = int(re.match(r"\d+", code).group())
@@ -170,13 +183,29 @@ def solve(codes: InputData, *, n_robots: int) -> int:
     return total
 
 
-def main(input_parsed: InputData):
-    score1 = solve(input_parsed, n_robots=3)
+MODES = {
+    "reference": {"parts_executor": "serial"},
+    "threads": {"parts_executor": "threads"},
+    "processes": {"parts_executor": "processes"},
+}
+
+
+def main(input_parsed: InputData, *, parts_executor: PartsExecutor = "serial") -> Answers:
+    results = run_parts([
+        Part("part1", functools.partial(solve, input_parsed, n_robots=3)),
+        Part("part2", functools.partial(solve, input_parsed, n_robots=26)),
+    ], executor=parts_executor)
+    score1 = results["part1"]
     print(f"{score1 = }")
-    score2 = solve(input_parsed, n_robots=26)
+    score2 = results["part2"]
     print(f"{score2 = }")
+    return Answers(score1, score2)
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--parts", choices=PARTS_EXECUTORS, default="serial", help="how to run the two parts")
+    args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input())
+        main(get_parsed_input(), parts_executor=args.parts)
@@ -1,7 +1,8 @@
 import itertools
 from collections import defaultdict
+from typing import Sequence
 
-from advent_utils import read_input, timer
+from advent_utils import PARALLEL_BACKENDS, Answers, ParallelBackend, iter_input_chunks, parallel_chunks, timer
 
 InputData = list[int]
 
@@ -10,8 +11,11 @@ TRIGGER_LEN = 4
 
 
 def get_parsed_input() -> InputData:
-    input_raw = read_input(22)
-    return list(map(int, input_raw.strip().splitlines()))
+    return [
+        int(secret)
+        for chunk in iter_input_chunks(22)
+        for secret in chunk.split()
+    ]
 
 
 def mix_and_prune(a: int, b: int) -> int:
@@ -32,7 +36,8 @@ def make_sequence(secret: int, *, n: int) -> list[int]:
     ]
 
 
-def find_best_sale(sequences: list[list[int]]) -> int:
+def find_sale_totals(sequences: list[list[int]]) -> dict[Trigger, int]:
+    """what each trigger would earn, added up over the buyers"""
     last_digits = [
         [secret % 10 for secret in seq]
         for seq in sequences
@@ -54,23 +59,50 @@ def find_best_sale(sequences: list[list[int]]) -> int:
         for trigger, value in seq_sales.items():
             totals_per_trigger[trigger] += value
     # print("# of unique triggers:", len(totals_per_trigger))
-    return max(totals_per_trigger.values())
+    return totals_per_trigger
 
 
-def main(input_parsed: InputData):
+def solve_buyers(secrets: Sequence[int]) -> tuple[int, dict[Trigger, int]]:
+    """the sum of the buyers' final secrets, and the sale totals per trigger, for some of the buyers"""
     sequences = [
         make_sequence(secret, n=2000)
-        for secret in input_parsed
+        for secret in secrets
     ]
-    total1 = sum(
+    total = sum(
         seq[-1]
         for seq in sequences
     )
+    return total, find_sale_totals(sequences)
+
+
+MODES = {
+    "reference": {"n_workers": 1},
+    "parallel": {"n_workers": 4},
+}
+
+
+def main(input_parsed: InputData, *, n_workers: int | None = 1, backend: ParallelBackend | None = None) -> Answers:
+    # each worker takes a share of the buyers, and the totals of the shares are added up here
+    chunk_results = parallel_chunks(solve_buyers, input_parsed, n_workers=n_workers, backend=backend)
+    total1 = sum(chunk_total for chunk_total, _ in chunk_results)
     print(f"{total1 = }")
-    best_sale_value = find_best_sale(sequences)
+    if len(chunk_results) == 1:
+        totals_per_trigger = chunk_results[0][1]
+    else:
+        totals_per_trigger = defaultdict(int)
+        for _, chunk_totals in chunk_results:
+            for trigger, value in chunk_totals.items():
+                totals_per_trigger[trigger] += value
+    best_sale_value = max(totals_per_trigger.values())
     print(f"{best_sale_value = }")
+    return Answers(total1, best_sale_value)
 
 
 if __name__ == "__main__":
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--workers", type=int, default=1, help="workers splitting the buyers (default: 1)")
+    arg_parser.add_argument("--backend", choices=PARALLEL_BACKENDS, help="default: threads if the GIL is off, else processes")
+    args = arg_parser.parse_args()
     with timer():
-        main(get_parsed_input())
+        main(get_parsed_input(), n_workers=args.workers, backend=args.backend)
@@ -2,7 +2,7 @@ import itertools
 from collections import defaultdict
 from typing import cast
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, BitSet, Indexer, read_input, timer
 
 InputData = list[tuple[str, str]]
 
@@ -16,7 +16,7 @@ def get_parsed_input() -> InputData:
     return input_parsed
 
 
-def main(input_parsed: InputData):
+def solve_sets(input_parsed: InputData) -> tuple[int, str]:
     # restructure input
     graph: dict[str, set[str]] = defaultdict(set)
     for a, b in input_parsed:
@@ -35,7 +35,6 @@ def main(input_parsed: InputData):
         any(elem.startswith("t") for elem in component)
         for component in components
     )
-    print(f"{n_with_t = }")
     # part 2
     biggest_component = set()
     for component_ in components:
@@ -51,7 +50,61 @@ def main(input_parsed: InputData):
         if len(component) > len(biggest_component):
             biggest_component = component
     password = ",".join(sorted(biggest_component))
+    return n_with_t, password
+
+
+def solve_bitsets(input_parsed: InputData) -> tuple[int, str]:
+    """the same as `solve_sets`, with computers numbered and sets of them as bitsets"""
+    # restructure input: computers are numbered, and each one's neighbors are a bitset of those numbers
+    names: Indexer[str] = Indexer(name for edge in input_parsed for name in edge)
+    neighbor_lists: list[list[int]] = [[] for _ in range(len(names))]
+    for a, b in input_parsed:
+        if a == b:
+            print(f"WARNING: self-loop! {a} -> {b}")
+        index_a, index_b = names.index(a), names.index(b)
+        neighbor_lists[index_a].append(index_b)
+        neighbor_lists[index_b].append(index_a)
+    graph = [BitSet(neighbor_list) for neighbor_list in neighbor_lists]
+    # part 1
+    components: list[BitSet] = []  # each triangle once, found from its lowest-numbered node
+    for node_a, neighbors in enumerate(graph):
+        for node_b in neighbors.above(node_a):
+            for node_c in (neighbors & graph[node_b]).above(node_b):
+                components.append(BitSet((node_a, node_b, node_c)))
+    t_nodes = BitSet(index for index in range(len(names)) if names.key(index).startswith("t"))
+    n_with_t = sum(
+        not component.isdisjoint(t_nodes)
+        for component in components
+    )
+    # part 2
+    biggest_component = BitSet()
+    for component_ in components:
+        if not component_.isdisjoint(biggest_component):
+            continue
+        component = component_.copy()
+        elem1 = next(iter(component))
+        for neighbor in graph[elem1]:
+            if neighbor in component:
+                continue
+            if component.issubset(graph[neighbor]):
+                component.add(neighbor)
+        if len(component) > len(biggest_component):
+            biggest_component = component
+    password = ",".join(sorted(names.keys_of(biggest_component)))
+    return n_with_t, password
+
+
+MODES = {
+    "reference": {"use_bitsets": False},
+    "bitsets": {"use_bitsets": True},
+}
+
+
+def main(input_parsed: InputData, *, use_bitsets: bool = False) -> Answers:
+    n_with_t, password = (solve_bitsets if use_bitsets else solve_sets)(input_parsed)
+    print(f"{n_with_t = }")
     print(f"{password = }")
+    return Answers(n_with_t, password)
 
 
 if __name__ == "__main__":
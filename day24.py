@@ -4,7 +4,7 @@ from collections import defaultdict
 from enum import StrEnum
 from typing import Literal, NamedTuple
 
-from advent_utils import read_input, timer
+from advent_utils import Answers, read_input, timer
 
 
 class BitOperator(StrEnum):
@@ -165,7 +165,7 @@ def find_problem_wires(input_parsed: InputData, z_out: int) -> set[str]:
             raise RuntimeError(f"confused 2 ({i = })")
     raise RuntimeError("IDK (end of loop)")
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     # part 1
     z_int = run_system(input_parsed)
     print(f"{z_int = }")
@@ -173,6 +173,7 @@ def main(input_parsed: InputData):
     problem_wires = find_problem_wires(input_parsed, z_int)
     problem_wires_str = ",".join(sorted(problem_wires))
     print(f"{problem_wires_str = }")
+    return Answers(z_int, problem_wires_str)
 
 
 if __name__ == "__main__":
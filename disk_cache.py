@@ -0,0 +1,163 @@
+import dataclasses
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import numpy as np
+
+import advent_utils
+from advent_utils import DATA_DIR, Answers, input_path
+
+CACHE_DIR = DATA_DIR / ".cache"
+
+_NPY_SUFFIX = ".npy"
+_PICKLE_SUFFIX = ".pickle"
+
+
+def file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def source_sha256(*modules: ModuleType) -> str:
+    sha = hashlib.sha256()
+    for module in modules:
+        sha.update(inspect.getsource(module).encode("utf-8"))
+    return sha.hexdigest()
+
+
+class DiskCache:
+    """
+    stores one file per key, as `.npy` for plain numpy arrays and pickle for everything else;
+    once the directory holds more than `max_bytes`, the least recently used entries are deleted
+    """
+
+    def __init__(self, directory: Path, *, max_bytes: int):
+        super().__init__()
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _entries(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return [
+            path
+            for path in self.directory.iterdir()
+            if path.suffix in (_NPY_SUFFIX, _PICKLE_SUFFIX)
+        ]
+
+    def get(self, key: str) -> Any:
+        """raises KeyError on a cache miss"""
+        for suffix in (_NPY_SUFFIX, _PICKLE_SUFFIX):
+            path = self.directory / f"{key}{suffix}"
+            try:
+                with open(path, "rb") as f:
+                    if suffix == _NPY_SUFFIX:
+                        value = np.load(f, allow_pickle=False)
+                    else:
+                        value = pickle.load(f)
+            except FileNotFoundError:
+                continue
+            os.utime(path)  # mark as recently used
+            return value
+        raise KeyError(key)
+
+    def put(self, key: str, value: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        use_npy = isinstance(value, np.ndarray) and not value.dtype.hasobject
+        path = self.directory / f"{key}{_NPY_SUFFIX if use_npy else _PICKLE_SUFFIX}"
+        # write to a temporary file first, so concurrent readers never see a partial entry
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as f:
+            try:
+                if use_npy:
+                    np.save(f, value, allow_pickle=False)
+                else:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # deleted by someone else
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):  # oldest first
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def clear(self):
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+
+PARSED_INPUT_CACHE = DiskCache(CACHE_DIR / "parsed", max_bytes=(256 * 2 ** 20))
+
+
+def day_of_module(module: ModuleType) -> int:
+    return int(module.__name__.removeprefix("day"))
+
+
+def parsed_input_key(module: ModuleType) -> str:
+    """depends on the input file, and on the source of both the day's module and `advent_utils` (which does the reading)"""
+    input_sha = file_sha256(input_path(day_of_module(module)))
+    code_sha = source_sha256(module, advent_utils)
+    return f"{module.__name__}-{input_sha[:16]}-{code_sha[:16]}"
+
+
+ANSWER_CACHE = DiskCache(CACHE_DIR / "answers", max_bytes=(16 * 2 ** 20))
+
+
+@dataclasses.dataclass
+class CachedSolve:
+    answers: Answers | None
+    output: str  # everything `main` printed, to show again instead of solving
+
+
+def answers_key(module: ModuleType, params: dict[str, Any]) -> str:
+    """like `parsed_input_key`, plus the keyword arguments given to `main`"""
+    params_sha = hashlib.sha256(repr(sorted(params.items())).encode("utf-8")).hexdigest()
+    return f"{parsed_input_key(module)}-{params_sha[:16]}"
+
+
+def get_cached_solve(module: ModuleType, params: dict[str, Any], *, cache: DiskCache = ANSWER_CACHE) -> CachedSolve | None:
+    try:
+        return cache.get(answers_key(module, params))
+    except KeyError:
+        return None
+
+
+def put_cached_solve(module: ModuleType, params: dict[str, Any], solve: CachedSolve, *, cache: DiskCache = ANSWER_CACHE):
+    cache.put(answers_key(module, params), solve)
+
+
+def cached_parsed_input(module: ModuleType, *, cache: DiskCache = PARSED_INPUT_CACHE) -> Any:
+    """like `module.get_parsed_input()`, but skips the parsing if this input was already parsed by this code"""
+    key = parsed_input_key(module)
+    try:
+        return cache.get(key)
+    except KeyError:
+        pass
+    input_parsed = module.get_parsed_input()
+    try:
+        cache.put(key, input_parsed)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        print(f"WARNING: could not cache parsed input of {module.__name__}: {e}", file=sys.stderr)
+    return input_parsed
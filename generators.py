@@ -0,0 +1,471 @@
+import math
+import random
+import string
+import sys
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+GeneratorFunc = Callable[..., str]  # (size, rng, **params) -> input text
+
+
+class InputGenerator(NamedTuple):
+    func: GeneratorFunc
+    puzzle_size: int  # `size` that roughly matches a real puzzle input
+    dims: int = 1  # 2 for N×N grids, so scaling the input by 10 scales the side by sqrt(10)
+    min_size: int = 1
+    max_size: int | None = None  # for days whose solution hard-codes some dimension of the input
+
+    def scaled_size(self, scale: float) -> int:
+        size = round(self.puzzle_size * scale ** (1 / self.dims))
+        size = max(size, self.min_size)
+        if self.max_size is not None:
+            size = min(size, self.max_size)
+        return size
+
+
+GENERATORS: dict[int, InputGenerator] = {}
+
+
+def generator(day: int, puzzle_size: int, **kwargs: Any) -> Callable[[GeneratorFunc], GeneratorFunc]:
+    def decorator(func: GeneratorFunc) -> GeneratorFunc:
+        GENERATORS[day] = InputGenerator(func, puzzle_size, **kwargs)
+        return func
+    return decorator
+
+
+def make_rng(day: int, seed: int) -> random.Random:
+    return random.Random(f"day{day:02}-{seed}")
+
+
+def generate(day: int, *, size: int | None = None, scale: float = 1.0, seed: int = 0, **params: Any) -> str:
+    """
+    makes a valid input for the day; `size` is the day's own size parameter (rows, cells per side, buyers, ...),
+    and defaults to the puzzle's size times `scale`. the same arguments always give the same input
+    """
+    try:
+        input_generator = GENERATORS[day]
+    except KeyError:
+        raise ValueError(f"no input generator for day {day}") from None
+    if size is None:
+        size = input_generator.scaled_size(scale)
+    elif size < input_generator.min_size or (input_generator.max_size is not None and size > input_generator.max_size):
+        raise ValueError(f"size for day {day} must be in [{input_generator.min_size}, {input_generator.max_size}]")
+    return input_generator.func(size, make_rng(day, seed), **params)
+
+
+def write_inputs(days: list[int], directory: Path, **kwargs: Any) -> dict[int, Path]:
+    """writes `dayNN.txt` files (same naming as the data directory); `kwargs` go to `generate`"""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for day in days:
+        path = directory / f"day{day:02}.txt"
+        path.write_text(generate(day, **kwargs), encoding="utf-8")
+        paths[day] = path
+    return paths
+
+
+def _grid_str(grid: list[list[str]]) -> str:
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+@generator(1, puzzle_size=1000)
+def day01(n_rows: int, rng: random.Random) -> str:
+    # both lists draw some numbers from a shared pool, so the similarity score has something to count
+    common = [rng.randint(10000, 99999) for _ in range(max(1, n_rows // 20))]
+
+    def number() -> int:
+        return rng.choice(common) if rng.random() < 0.3 else rng.randint(10000, 99999)
+
+    return "".join(f"{number()}   {number()}\n" for _ in range(n_rows))
+
+
+@generator(2, puzzle_size=1000)
+def day02(n_reports: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(n_reports):
+        level = rng.randint(1, 90)
+        levels = [level]
+        sign = rng.choice((1, -1))
+        for _ in range(rng.randint(4, 7)):
+            level += sign * rng.choice((0, 1, 2, 3, 3, 4))
+            levels.append(level)
+        lines.append(" ".join(map(str, levels)))
+    return "".join(line + "\n" for line in lines)
+
+
+@generator(3, puzzle_size=3000)
+def day03(n_tokens: int, rng: random.Random) -> str:
+    tokens = []
+    for _ in range(n_tokens):
+        if rng.random() < 0.5:
+            tokens.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        else:
+            tokens.append(rng.choice(("do()", "don't()", "mul(4*", "mul[3,7]", "mul ( 2 , 4 )", "?", "%&", "when()")))
+    return "".join(tokens) + "\n"
+
+
+@generator(4, puzzle_size=140, dims=2)
+def day04(side: int, rng: random.Random) -> str:
+    return _grid_str([[rng.choice("XMAS") for _ in range(side)] for _ in range(side)])
+
+
+@generator(5, puzzle_size=200)
+def day05(n_updates: int, rng: random.Random, *, n_pages: int = 49) -> str:
+    # every pair of pages has a rule, consistent with one hidden total order
+    if not 5 <= n_pages <= 90:
+        raise ValueError("n_pages must be in [5, 90]")
+    pages = rng.sample(range(10, 100), n_pages)
+    rules = [f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(n_updates):
+        update = rng.sample(pages, rng.randrange(5, min(n_pages, 23) + 1, 2))  # odd lengths have a middle page
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _guard_escapes(grid: list[list[str]], row: int, col: int) -> bool:
+    side = len(grid)
+    d_row, d_col = -1, 0
+    seen = set()
+    while (row, col, d_row, d_col) not in seen:
+        seen.add((row, col, d_row, d_col))
+        row_next, col_next = row + d_row, col + d_col
+        if not (0 <= row_next < side and 0 <= col_next < side):
+            return True
+        if grid[row_next][col_next] == "#":
+            d_row, d_col = d_col, -d_row  # turn right
+        else:
+            row, col = row_next, col_next
+    return False
+
+
+@generator(6, puzzle_size=130, dims=2, min_size=3)
+def day06(side: int, rng: random.Random, *, wall_density: float = 0.05) -> str:
+    while True:  # the guard has to leave the grid in the unmodified map
+        grid = [["#" if rng.random() < wall_density else "." for _ in range(side)] for _ in range(side)]
+        row, col = rng.randrange(side), rng.randrange(side)
+        grid[row][col] = "^"
+        if _guard_escapes(grid, row, col):
+            return _grid_str(grid)
+
+
+@generator(7, puzzle_size=850)
+def day07(n_equations: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(n_equations):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        result = operands[0]
+        for operand in operands[1:]:
+            result = rng.choice((result + operand, result * operand, int(f"{result}{operand}")))
+        if rng.random() < 0.3:
+            result += 1  # probably unsolvable
+        lines.append(f"{result}: " + " ".join(map(str, operands)))
+    return "".join(line + "\n" for line in lines)
+
+
+@generator(8, puzzle_size=50, dims=2)
+def day08(side: int, rng: random.Random) -> str:
+    grid = [["."] * side for _ in range(side)]
+    frequencies = string.ascii_letters + string.digits
+    for _ in range(side * side // 12):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return _grid_str(grid)
+
+
+@generator(9, puzzle_size=19999)
+def day09(length: int, rng: random.Random) -> str:
+    length |= 1  # ends with a file
+    return "".join(str(rng.randint(1, 9) if i % 2 == 0 else rng.randint(0, 9)) for i in range(length)) + "\n"
+
+
+@generator(10, puzzle_size=57, dims=2)
+def day10(side: int, rng: random.Random) -> str:
+    # diagonal ramps make plenty of trails; the noise breaks some of them up
+    return _grid_str([
+        [str((i + j) % 10 if rng.random() < 0.9 else rng.randrange(10)) for j in range(side)]
+        for i in range(side)
+    ])
+
+
+@generator(11, puzzle_size=8)
+def day11(n_stones: int, rng: random.Random) -> str:
+    return " ".join(str(rng.choice((rng.randint(0, 9), rng.randint(0, 999_999)))) for _ in range(n_stones)) + "\n"
+
+
+@generator(12, puzzle_size=140, dims=2)
+def day12(side: int, rng: random.Random) -> str:
+    # mostly copy the plant above or to the left, so regions come out as blobs
+    grid = [[""] * side for _ in range(side)]
+    for i in range(side):
+        for j in range(side):
+            r = rng.random()
+            if r < 0.45 and i > 0:
+                grid[i][j] = grid[i - 1][j]
+            elif r < 0.9 and j > 0:
+                grid[i][j] = grid[i][j - 1]
+            else:
+                grid[i][j] = rng.choice(string.ascii_uppercase)
+    return _grid_str(grid)
+
+
+@generator(13, puzzle_size=320)
+def day13(n_machines: int, rng: random.Random) -> str:
+    blocks = []
+    for _ in range(n_machines):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        n_a, n_b = rng.randint(1, 100), rng.randint(1, 100)
+        prize_x, prize_y = n_a * ax + n_b * bx, n_a * ay + n_b * by
+        if rng.random() < 0.4:
+            prize_x += rng.randint(1, 9)  # probably unwinnable
+        blocks.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={prize_x}, Y={prize_y}\n")
+    return "\n".join(blocks)
+
+
+@generator(14, puzzle_size=500)
+def day14(n_robots: int, rng: random.Random) -> str:
+    # positions are in (row, col) order as the solver reads them, on its fixed 101x103 grid
+    return "".join(
+        f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}\n"
+        for _ in range(n_robots)
+    )
+
+
+@generator(15, puzzle_size=50, dims=2, min_size=4)
+def day15(side: int, rng: random.Random, *, moves_per_cell: int = 8) -> str:
+    grid = [
+        ["#" if i in (0, side - 1) or j in (0, side - 1) else rng.choice("....OO#") for j in range(side)]
+        for i in range(side)
+    ]
+    grid[side // 2][side // 2] = "@"
+    moves = "".join(rng.choice("<>^v") for _ in range(moves_per_cell * side * side))
+    return _grid_str(grid) + "\n" + "".join(moves[i:(i + 1000)] + "\n" for i in range(0, len(moves), 1000))
+
+
+def _carve_maze(side: int, rng: random.Random) -> list[list[str]]:
+    """a perfect maze (exactly one path between any two cells) by depth-first carving; cells sit on odd coordinates"""
+    grid = [["#"] * side for _ in range(side)]
+    start = (side - 2, 1)
+    grid[start[0]][start[1]] = "."
+    stack = [start]
+    while len(stack) > 0:
+        row, col = stack[-1]
+        options = [
+            (row + d_row, col + d_col)
+            for d_row, d_col in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + d_row < side - 1 and 0 < col + d_col < side - 1 and grid[row + d_row][col + d_col] == "#"
+        ]
+        if len(options) == 0:
+            stack.pop()
+            continue
+        row_next, col_next = rng.choice(options)
+        grid[(row + row_next) // 2][(col + col_next) // 2] = "."
+        grid[row_next][col_next] = "."
+        stack.append((row_next, col_next))
+    return grid
+
+
+@generator(16, puzzle_size=141, dims=2, min_size=5)
+def day16(side: int, rng: random.Random, *, loop_density: float = 0.1) -> str:
+    side |= 1
+    grid = _carve_maze(side, rng)
+    # knocking out extra walls adds loops, and so tied best paths
+    for i in range(1, side - 1):
+        for j in range(1, side - 1):
+            if grid[i][j] == "#" and (i + j) % 2 == 1 and rng.random() < loop_density:
+                grid[i][j] = "."
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return _grid_str(grid)
+
+
+def _run_chronospatial(a: int, x: int, y: int) -> list[int]:
+    """runs the puzzle's kind of program (with constants `x` and `y`): one loop, printing once per 3 bits of `a`"""
+    output = []
+    while True:
+        b = (a % 8) ^ x
+        c = a >> b
+        output.append((b ^ y ^ c) % 8)
+        a >>= 3
+        if a == 0:
+            return output
+
+
+def _find_quine_a(program: list[int], x: int, y: int) -> int | None:
+    candidates = [0]
+    for n_digits in range(1, len(program) + 1):
+        target = program[-n_digits:]
+        candidates = [
+            (a << 3) | digit
+            for a in candidates
+            for digit in range(8)
+            if ((a << 3) | digit) > 0 and _run_chronospatial((a << 3) | digit, x, y) == target
+        ]
+    return min(candidates, default=None)
+
+
+@generator(17, puzzle_size=9)
+def day17(n_octal_digits: int, rng: random.Random) -> str:
+    # the solution's part 2 only handles programs of the puzzle's shape, so only the constants and `a` vary;
+    # the program must also be able to print itself for some `a`
+    while True:
+        x, y = rng.randrange(8), rng.randrange(8)
+        middle = [(1, y), (4, rng.randrange(8))]
+        rng.shuffle(middle)
+        program = [2, 4, 1, x, 7, 5, *middle[0], *middle[1], 5, 5, 0, 3, 3, 0]
+        if _find_quine_a(program, x, y) is not None:
+            break
+    a = rng.randrange(8 ** (n_octal_digits - 1), 8 ** n_octal_digits)
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {",".join(map(str, program))}\n"
+
+
+@generator(18, puzzle_size=3450, min_size=(1024 + 71), max_size=(71 * 71 - 2))
+def day18(n_bytes: int, rng: random.Random) -> str:
+    # the solution's memory space is fixed at 71x71, with the first 1024 bytes for part 1
+    side = 71
+    cells = [(x, y) for x in range(side) for y in range(side) if (x, y) not in ((0, 0), (side - 1, side - 1))]
+    rng.shuffle(cells)
+    # a full row is a guaranteed total blocker; make sure it's complete within the bytes given, but not in part 1
+    wall_y = rng.randrange(1, side - 1)
+    wall = [(x, wall_y) for x in range(side)]
+    cells = [cell for cell in cells if cell[1] != wall_y]
+    for cell in wall:
+        cells.insert(rng.randrange(1024, n_bytes - len(wall) + 1), cell)
+    return "".join(f"{x},{y}\n" for x, y in cells[:n_bytes])
+
+
+@generator(19, puzzle_size=400)
+def day19(n_designs: int, rng: random.Random, *, n_patterns: int = 447) -> str:
+    # no single-stripe "g" pattern, so some designs can't be made
+    patterns = set()
+    while len(patterns) < n_patterns:
+        pattern = "".join(rng.choice("wubrg") for _ in range(rng.randint(1, 8)))
+        if pattern != "g":
+            patterns.add(pattern)
+    designs = ["".join(rng.choice("wubrg") for _ in range(rng.randint(20, 60))) for _ in range(n_designs)]
+    return ", ".join(sorted(patterns)) + "\n\n" + "".join(design + "\n" for design in designs)
+
+
+@generator(20, puzzle_size=141, dims=2, min_size=5)
+def day20(side: int, rng: random.Random) -> str:
+    # the race track has no branches, so it's the one path through a perfect maze; everything else goes back to wall
+    side |= 1
+    maze = _carve_maze(side, rng)
+    start, end = (side - 2, 1), (1, side - 2)
+    came_from = {start: start}
+    to_visit = [start]
+    while len(to_visit) > 0:
+        row, col = to_visit.pop()
+        for row_next, col_next in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if maze[row_next][col_next] == "." and (row_next, col_next) not in came_from:
+                came_from[(row_next, col_next)] = (row, col)
+                to_visit.append((row_next, col_next))
+    grid = [["#"] * side for _ in range(side)]
+    loc = end
+    while loc != start:
+        grid[loc[0]][loc[1]] = "."
+        loc = came_from[loc]
+    grid[start[0]][start[1]] = "S"
+    grid[end[0]][end[1]] = "E"
+    return _grid_str(grid)
+
+
+@generator(21, puzzle_size=5)
+def day21(n_codes: int, rng: random.Random) -> str:
+    return "".join(f"{rng.randrange(1000):03}A\n" for _ in range(n_codes))
+
+
+@generator(22, puzzle_size=2000)
+def day22(n_buyers: int, rng: random.Random) -> str:
+    return "".join(f"{rng.randint(1, 2 ** 24 - 1)}\n" for _ in range(n_buyers))
+
+
+@generator(23, puzzle_size=520, min_size=13)
+def day23(n_computers: int, rng: random.Random, *, degree: int = 13) -> str:
+    # two-letter names, like the puzzle's, until there are too many computers for that
+    name_length = max(2, math.ceil(math.log(n_computers, 26)))
+    names: set[str] = set()
+    while len(names) < n_computers:
+        names.add("".join(rng.choice(string.ascii_lowercase) for _ in range(name_length)))
+    nodes = sorted(names)
+    rng.shuffle(nodes)
+    edges = set()
+    # plant one big LAN party (a clique), then connect everything else sparsely at random
+    clique = nodes[:degree]
+    for i, a in enumerate(clique):
+        for b in clique[i + 1:]:
+            edges.add((a, b))
+    for _ in range(n_computers * (degree - 1) // 2):
+        a, b = rng.sample(nodes, 2)
+        if (b, a) not in edges:
+            edges.add((a, b))
+    edges_list = [f"{a}-{b}" for a, b in edges]
+    rng.shuffle(edges_list)
+    return "".join(edge + "\n" for edge in edges_list)
+
+
+@generator(24, puzzle_size=45, min_size=2, max_size=99)
+def day24(n_bits: int, rng: random.Random, *, n_swaps: int = 0) -> str:
+    """
+    a ripple-carry adder (as in the puzzle) with `n_swaps` pairs of gate outputs swapped;
+    the solution's part 2 is hand-written for the puzzle's own swaps, so other inputs only fully run with `n_swaps=0`
+    (swaps can even make the circuit cyclic)
+    """
+    used_names: set[str] = set()
+
+    def new_wire() -> str:
+        while True:
+            name = "".join(rng.choice(string.ascii_lowercase) for _ in range(3))
+            if name[0] not in "xyz" and name not in used_names:
+                used_names.add(name)
+                return name
+
+    gates = [["x00", "XOR", "y00", "z00"], ["x00", "AND", "y00", new_wire()]]
+    carry = gates[-1][3]
+    for i in range(1, n_bits):
+        half_sum, half_carry, carry_through = new_wire(), new_wire(), new_wire()
+        carry_next = new_wire() if i < n_bits - 1 else f"z{n_bits:02}"
+        gates += [
+            [f"x{i:02}", "XOR", f"y{i:02}", half_sum],
+            [half_sum, "XOR", carry, f"z{i:02}"],
+            [f"x{i:02}", "AND", f"y{i:02}", half_carry],
+            [half_sum, "AND", carry, carry_through],
+            [half_carry, "OR", carry_through, carry_next],
+        ]
+        carry = carry_next
+    if 2 * n_swaps > len(gates):
+        raise ValueError("too many swaps for this many bits")
+    swapped = rng.sample(gates, 2 * n_swaps)
+    for gate1, gate2 in zip(swapped[::2], swapped[1::2]):
+        gate1[3], gate2[3] = gate2[3], gate1[3]
+    for gate in gates:
+        if rng.random() < 0.5:
+            gate[0], gate[2] = gate[2], gate[0]
+    rng.shuffle(gates)
+    initial_values = [f"{name}{i:02}: {rng.randint(0, 1)}" for name in "xy" for i in range(n_bits)]
+    return "\n".join(initial_values) + "\n\n" + "".join(f"{a} {op} {b} -> {out}\n" for a, op, b, out in gates)
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="generate synthetic inputs, scaled relative to the real puzzle inputs")
+    arg_parser.add_argument("days", nargs="*", type=int, help="days to generate inputs for (default: all)")
+    arg_parser.add_argument("-o", "--output", type=Path, required=True, metavar="DIR", help="directory to write dayNN.txt files to")
+    size_group = arg_parser.add_mutually_exclusive_group()
+    size_group.add_argument("--scale", type=float, default=1.0, help="input size relative to the puzzle's")
+    size_group.add_argument("--size", type=int, help="the day's own size parameter, instead of --scale")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+    days = args.days or sorted(GENERATORS.keys())
+    if missing_days := sorted(set(days) - set(GENERATORS.keys())):
+        arg_parser.error(f"no generator for day(s): {missing_days}")
+    for day in days:
+        size = args.size if args.size is not None else GENERATORS[day].scaled_size(args.scale)
+        path, = write_inputs([day], args.output, size=size, seed=args.seed).values()
+        print(f"day {day:02}: {size = } -> {path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
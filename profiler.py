@@ -0,0 +1,94 @@
+import cProfile
+import contextlib
+import pstats
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from advent_utils import use_input
+from runner import find_days, import_day
+
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+_FuncKey = tuple[str, int, str]  # (file name, line number, function name), as pstats has them
+
+
+def profile_day(day: int, *, input_path: Path | None = None) -> pstats.Stats:
+    """runs `main(get_parsed_input())` for the day under cProfile (parsing included, importing not)"""
+    module = import_day(day)
+    profiler = cProfile.Profile()
+    with use_input(input_path) if input_path is not None else contextlib.nullcontext():
+        profiler.enable()
+        try:
+            module.main(module.get_parsed_input())
+        finally:
+            profiler.disable()
+    return pstats.Stats(profiler)
+
+
+def _callgrind_name(func: _FuncKey) -> str:
+    file_name, line, func_name = func
+    if file_name == "~":  # built-ins
+        return func_name
+    return f"{func_name}:{line}"
+
+
+def write_callgrind(stats: pstats.Stats, path: Path):
+    """
+    writes the profile in the callgrind format read by KCachegrind / QCachegrind, with costs in microseconds;
+    pstats only records who called each function, so the callee lists are built by inverting that
+    """
+    callees: dict[_FuncKey, dict[_FuncKey, tuple[int, float]]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, n_calls, _, cumulative_time) in callers.items():
+            callees[caller][func] = (n_calls, cumulative_time)
+    lines = ["# callgrind format", "events: Microseconds", ""]
+    for func, (_, _, total_time, _, _) in stats.stats.items():
+        file_name, line, _ = func
+        lines += [f"fl={file_name}", f"fn={_callgrind_name(func)}", f"{line} {round(total_time * 1e6)}"]
+        for callee, (n_calls, cumulative_time) in callees[func].items():
+            lines += [
+                f"cfl={callee[0]}",
+                f"cfn={_callgrind_name(callee)}",
+                f"calls={n_calls} {callee[1]}",
+                f"{line} {round(cumulative_time * 1e6)}",
+            ]
+        lines.append("")
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def export_profile(stats: pstats.Stats, directory: Path, stem: str) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    prof_path = directory / f"{stem}.prof"
+    stats.dump_stats(prof_path)
+    callgrind_path = directory / f"callgrind.out.{stem}"  # KCachegrind recognizes the `callgrind.out.` prefix
+    write_callgrind(stats, callgrind_path)
+    return [prof_path, callgrind_path]
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="run days under cProfile and print where the time goes")
+    arg_parser.add_argument("days", nargs="+", type=int, help="days to profile")
+    arg_parser.add_argument("-o", "--output", type=Path, metavar="DIR", help="directory to write .prof and callgrind files to")
+    arg_parser.add_argument("--top", type=int, default=25, help="number of functions to print")
+    arg_parser.add_argument("--sort", choices=SORT_KEYS, default="cumulative", help="what to sort the printed functions by")
+    arg_parser.add_argument("--input", type=Path, help="input file to use instead of data/dayNN.txt (only with one day)")
+    args = arg_parser.parse_args()
+    available_days = find_days()
+    if missing_days := sorted(set(args.days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+    if args.input is not None and len(args.days) > 1:
+        arg_parser.error("--input only works with a single day")
+
+    for day in args.days:
+        print(f"===== day {day:02} =====")
+        stats = profile_day(day, input_path=args.input)
+        stats.sort_stats(args.sort).print_stats(args.top)
+        if args.output is not None:
+            for path in export_profile(stats, args.output, f"day{day:02}"):
+                print(f"wrote {path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
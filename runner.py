@@ -0,0 +1,188 @@
+import contextlib
+import dataclasses
+import functools
+import importlib
+import inspect
+import io
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+
+import numpy  # noqa: F401 (imported before the pool forks, so workers don't each import it)
+
+from advent_utils import PARTS_EXECUTORS, Answers, PartsExecutor, Span, export_span_tree, format_span_tree, span
+from disk_cache import CachedSolve, cached_parsed_input, get_cached_solve, put_cached_solve
+
+ROOT_DIR = Path(__file__).parent
+RE_DAY_MODULE = re.compile(r"day(\d{2})")
+
+
+def find_days() -> list[int]:
+    return sorted(
+        int(match.group(1))
+        for path in ROOT_DIR.glob("day*.py")
+        if (match := RE_DAY_MODULE.fullmatch(path.stem))
+    )
+
+
+def import_day(day: int) -> ModuleType:
+    return importlib.import_module(f"day{day:02}")
+
+
+def clear_caches(module: ModuleType):
+    """
+    empties the module-level caches of a day that keeps results across inputs (it has a `cache_clear`),
+    so that a timed run doesn't just replay an earlier run's results; batch.py keeps them warm on purpose
+    """
+    if (cache_clear := getattr(module, "cache_clear", None)) is not None:
+        cache_clear()
+
+
+@dataclasses.dataclass
+class DayReport:
+    day: int
+    output: str = ""
+    import_seconds: float | None = None
+    parse_seconds: float | None = None
+    solve_seconds: float | None = None
+    error: str | None = None
+    spans: Span | None = None
+    answers: Answers | None = None
+    from_answer_cache: bool = False
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(
+            seconds
+            for seconds in (self.import_seconds, self.parse_seconds, self.solve_seconds)
+            if seconds is not None
+        )
+
+
+def main_kwargs(module: ModuleType, *, parts_executor: PartsExecutor) -> dict[str, PartsExecutor]:
+    """days that split their solution into parts (see `advent_utils.run_parts`) take how to run them"""
+    if "parts_executor" in inspect.signature(module.main).parameters:
+        return {"parts_executor": parts_executor}
+    return {}
+
+
+def run_day(
+    day: int, *, parse_cache: bool = False, answer_cache: bool = False, force: bool = False,
+    parts_executor: PartsExecutor = "serial",
+) -> DayReport:
+    """
+    imports, parses and solves one day, capturing everything it prints;
+    with `answer_cache`, a day already solved for this input by this code just prints its stored output again
+    (unless `force`, which solves anyway and replaces what was stored)
+    """
+    report = DayReport(day)
+    captured = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(captured), contextlib.redirect_stderr(captured), span(f"day{day:02}") as root:
+            report.spans = root
+            with span("import") as import_span:
+                module = import_day(day)
+            report.import_seconds = import_span.wall_seconds
+            cached = get_cached_solve(module, {}) if answer_cache and not force else None
+            if cached is not None:
+                print(cached.output, end="")
+                report.answers = cached.answers
+                report.from_answer_cache = True
+            else:
+                with span("parse") as parse_span:
+                    if parse_cache:
+                        input_parsed = cached_parsed_input(module)
+                    else:
+                        input_parsed = module.get_parsed_input()
+                report.parse_seconds = parse_span.wall_seconds
+                solve_output_start = captured.tell()
+                with span("solve") as solve_span:
+                    report.answers = module.main(input_parsed, **main_kwargs(module, parts_executor=parts_executor))
+                report.solve_seconds = solve_span.wall_seconds
+                if answer_cache:
+                    put_cached_solve(module, {}, CachedSolve(report.answers, captured.getvalue()[solve_output_start:]))
+    except Exception:
+        report.error = traceback.format_exc()
+    report.output = captured.getvalue()
+    return report
+
+
+def run_days(days: list[int], *, n_workers: int | None = None, **kwargs) -> list[DayReport]:
+    """`kwargs` go to `run_day`"""
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(functools.partial(run_day, **kwargs), days))
+
+
+def _format_seconds(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds:.3f}"
+
+
+def print_report(reports: list[DayReport], *, wall_seconds: float, show_output: bool, show_spans: bool):
+    if show_output or show_spans:
+        for report in reports:
+            print(f"===== day {report.day:02} =====")
+            if show_output:
+                print(report.output, end="")
+            if report.error is not None:
+                print(report.error, end="")
+            if show_spans and report.spans is not None:
+                print("\n".join(format_span_tree(report.spans)))
+        print()
+    print(f"{'day':>3}  {'import':>8}  {'parse':>8}  {'solve':>8}  {'total':>8}")
+    for report in reports:
+        columns = [f"{report.day:>3}"] + [
+            f"{_format_seconds(seconds):>8}"
+            for seconds in (report.import_seconds, report.parse_seconds, report.solve_seconds, report.total_seconds)
+        ]
+        if report.error is not None:
+            columns.append("FAILED")
+        elif report.from_answer_cache:
+            columns.append("(answers cached)")
+        print(*columns, sep="  ")
+    sum_seconds = sum(report.total_seconds for report in reports)
+    print(f"[{wall_seconds:.3f} seconds wall time; {sum_seconds:.3f} seconds summed across days]")
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="run Advent of Code solutions in parallel, one process per day")
+    arg_parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count(), help="size of the process pool")
+    arg_parser.add_argument("--quiet", action="store_true", help="don't print the output of each day")
+    arg_parser.add_argument("--parse-cache", action="store_true", help="reuse parsed inputs cached in data/.cache")
+    arg_parser.add_argument("--answer-cache", action="store_true", help="reuse answers stored in data/.cache for this input and code")
+    arg_parser.add_argument("--force", action="store_true", help="with --answer-cache, solve anyway and store the new answers")
+    arg_parser.add_argument(
+        "--parts", choices=PARTS_EXECUTORS, default="serial",
+        help="how days made of independent parts run them (threads only help on a free-threaded build)",
+    )
+    arg_parser.add_argument("--trace", type=Path, metavar="DIR", help="print each day's spans and export them to this directory")
+    args = arg_parser.parse_args()
+    available_days = find_days()
+    days = args.days or available_days
+    if missing_days := sorted(set(days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+    if args.force and not args.answer_cache:
+        arg_parser.error("--force only makes sense with --answer-cache")
+    time_start = time.perf_counter()
+    reports = run_days(
+        days, n_workers=args.workers, parse_cache=args.parse_cache, answer_cache=args.answer_cache, force=args.force,
+        parts_executor=args.parts,
+    )
+    wall_seconds = time.perf_counter() - time_start
+    print_report(reports, wall_seconds=wall_seconds, show_output=(not args.quiet), show_spans=(args.trace is not None))
+    if args.trace is not None:
+        for report in reports:
+            if report.spans is not None:
+                export_span_tree(report.spans, args.trace, f"day{report.day:02}")
+    if any(report.error is not None for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import dataclasses
+import inspect
+import os
+import platform
+import tempfile
+from pathlib import Path
+
+from advent_utils import PARALLEL_BACKENDS, ParallelBackend, default_backend, gil_enabled, input_path
+from generators import GENERATORS, write_inputs
+from runner import find_days, import_day
+from verify import run_mode
+
+SCALING_DAYS = (6, 7, 19, 22)
+WORKER_COUNTS = (1, 2, 4, 8, 16)
+
+
+@dataclasses.dataclass
+class ScalingReport:
+    day: int
+    backend: ParallelBackend
+    seconds: dict[int, float]  # by number of workers
+
+    def speedup(self, n_workers: int) -> float:
+        """against the fewest workers measured (normally 1)"""
+        baseline_seconds = self.seconds[min(self.seconds)]
+        return baseline_seconds / self.seconds[n_workers]
+
+
+def takes_workers(day: int) -> bool:
+    return "n_workers" in inspect.signature(import_day(day).main).parameters
+
+
+def measure_scaling(
+        day: int, path: Path, *, backend: ParallelBackend, worker_counts: list[int], n_repeats: int,
+) -> ScalingReport:
+    module = import_day(day)
+    seconds = {
+        n_workers: min(
+            run_mode(module, path, {"n_workers": n_workers, "backend": backend})[1]
+            for _ in range(n_repeats)
+        )
+        for n_workers in worker_counts
+    }
+    return ScalingReport(day, backend, seconds)
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="time days that can split their work at several worker counts")
+    arg_parser.add_argument("days", nargs="*", type=int, help=f"days to run (default: {', '.join(map(str, SCALING_DAYS))})")
+    arg_parser.add_argument("-w", "--workers", nargs="+", type=int, default=list(WORKER_COUNTS), help="worker counts to try")
+    arg_parser.add_argument("--backend", choices=PARALLEL_BACKENDS, help="default: threads if the GIL is off, else processes")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="runs per worker count; the fastest one counts")
+    arg_parser.add_argument("--scale", type=float, help="use generated inputs this many times the puzzle's size")
+    arg_parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    args = arg_parser.parse_args()
+    available_days = find_days()
+    days = args.days or list(SCALING_DAYS)
+    if missing_days := sorted(set(days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+    if unsplittable_days := [day for day in days if not takes_workers(day)]:
+        arg_parser.error(f"day(s) {unsplittable_days} can't split their work between workers")
+    if min(args.workers) < 1:
+        arg_parser.error("worker counts must be at least 1")
+    worker_counts = sorted(set(args.workers))
+    backend = args.backend if args.backend is not None else default_backend()
+
+    gil_str = "enabled" if gil_enabled() else "disabled"
+    print(f"python {platform.python_version()}, GIL {gil_str}, {os.cpu_count()} CPUs, backend: {backend}")
+    print(f"{'day':>3}  " + "  ".join(f"{f'{n_workers} workers':>17}" for n_workers in worker_counts))
+    with tempfile.TemporaryDirectory() as generated_dir:
+        for day in days:
+            if args.scale is not None and day in GENERATORS:
+                path, = write_inputs([day], Path(generated_dir), scale=args.scale, seed=args.seed).values()
+            elif input_path(day).exists():
+                path = input_path(day)
+            else:
+                print(f"{day:>3}  (no input; pass --scale to generate one)")
+                continue
+            report = measure_scaling(day, path, backend=backend, worker_counts=worker_counts, n_repeats=args.repeat)
+            print(f"{day:>3}  " + "  ".join(
+                f"{report.seconds[n_workers]:8.3f} ({report.speedup(n_workers):5.2f}x)"
+                for n_workers in worker_counts
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import compileall
+import dataclasses
+import re
+import subprocess
+import sys
+
+from runner import ROOT_DIR, find_days
+
+DEFAULT_BUDGET_MS = 40.0  # the interpreter's own `typing`, `pathlib` and `enum` come to about 30 ms here
+# these days use numpy from import time on (module-level arrays, `np.ndarray` aliases, ...)
+BUDGETS_MS = {
+    day: 250.0
+    for day in (4, 6, 8, 9, 10, 12, 13, 14, 15, 16, 18, 20, 21)
+}
+BUDGETS_MS[17] = 60.0  # its dataclasses pull in `inspect` and `ast`
+
+RE_IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclasses.dataclass
+class ImportRecord:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(stderr: str) -> list[ImportRecord]:
+    return [
+        ImportRecord(name, int(self_us), int(cumulative_us), len(indent) // 2)
+        for self_us, cumulative_us, indent, name in RE_IMPORT_TIME.findall(stderr)
+    ]
+
+
+def measure_import(module_name: str) -> tuple[ImportRecord, list[ImportRecord]]:
+    """imports the module in a fresh interpreter; returns its own record, plus records for everything it pulled in"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    records = parse_import_times(result.stderr)
+    # records come children-first, so the module's dependencies are the ones after the previous top-level import
+    subtree: list[ImportRecord] = []
+    for record in records:
+        if record.depth > 0:
+            subtree.append(record)
+        elif record.name == module_name:
+            return record, subtree
+        else:
+            subtree = []
+    raise RuntimeError(f"no import time reported for {module_name}")
+
+
+@dataclasses.dataclass
+class StartupReport:
+    day: int
+    import_ms: float
+    budget_ms: float
+    heaviest: list[ImportRecord]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.import_ms > self.budget_ms
+
+
+def check_day(day: int, *, n_repeats: int, budget_ms: float) -> StartupReport:
+    best: tuple[ImportRecord, list[ImportRecord]] | None = None
+    for _ in range(n_repeats):
+        record, subtree = measure_import(f"day{day:02}")
+        if best is None or record.cumulative_us < best[0].cumulative_us:
+            best = (record, subtree)
+    record, subtree = best
+    heaviest = sorted(subtree, key=lambda r: r.self_us, reverse=True)[:3]
+    return StartupReport(day, record.cumulative_us / 1e3, budget_ms, heaviest)
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="check how long each day takes to import, using `python -X importtime`")
+    arg_parser.add_argument("days", nargs="*", type=int, help="days to check (default: all)")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="imports per day; the fastest one counts")
+    arg_parser.add_argument("--budget", type=float, help="budget in milliseconds for every day, instead of the defaults")
+    args = arg_parser.parse_args()
+    available_days = find_days()
+    days = args.days or available_days
+    if missing_days := sorted(set(days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+    # a scheduler launching these scripts repeatedly runs from cached bytecode, so don't measure compilation
+    compileall.compile_dir(ROOT_DIR, maxlevels=0, quiet=1)
+
+    reports = []
+    print(f"{'day':>3}  {'import ms':>9}  {'budget':>7}  heaviest imports (self ms)")
+    for day in days:
+        budget_ms = args.budget if args.budget is not None else BUDGETS_MS.get(day, DEFAULT_BUDGET_MS)
+        report = check_day(day, n_repeats=args.repeat, budget_ms=budget_ms)
+        reports.append(report)
+        heaviest_str = ", ".join(f"{r.name} ({r.self_us / 1e3:.1f})" for r in report.heaviest)
+        status = "OVER BUDGET  " if report.over_budget else ""
+        print(f"{day:>3}  {report.import_ms:9.1f}  {report.budget_ms:7.1f}  {status}{heaviest_str}")
+    if any(report.over_budget for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from advent_utils import read_input, timer
+from advent_utils import Answers, read_input, timer
 
 InputData = str
 
@@ -8,8 +8,13 @@ def get_parsed_input() -> InputData:
     return input_raw
 
 
-def main(input_parsed: InputData):
+def main(input_parsed: InputData) -> Answers:
     print("Hello from advent2024!")
+    answer1 = None
+    print(f"{answer1 = }")
+    answer2 = None
+    print(f"{answer2 = }")
+    return Answers(answer1, answer2)
 
 
 if __name__ == "__main__":
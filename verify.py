@@ -0,0 +1,134 @@
+import contextlib
+import dataclasses
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from advent_utils import input_path, use_input
+from generators import GENERATORS, write_inputs
+from runner import clear_caches, find_days, import_day
+
+REFERENCE_MODE = "reference"
+
+
+def day_modes(module: ModuleType) -> dict[str, dict[str, Any]]:
+    """
+    a day with more than one way of solving lists them in `MODES`, as keyword arguments to its `main`;
+    the "reference" mode is the straightforward implementation, which the others must agree with
+    """
+    modes = getattr(module, "MODES", {REFERENCE_MODE: {}})
+    if REFERENCE_MODE not in modes:
+        raise ValueError(f"{module.__name__}.MODES has no {REFERENCE_MODE!r} mode")
+    return modes
+
+
+def _answer_lines(output: str, mode_kwargs: dict[str, Any]) -> list[str]:
+    """the printed lines, minus any that just echo the mode's own settings (a `name = value` line for one of its kwargs)"""
+    return [
+        line
+        for line in output.splitlines()
+        if not any(line.startswith(f"{name} = ") for name in mode_kwargs)
+    ]
+
+
+@dataclasses.dataclass
+class ModeResult:
+    mode: str
+    answer_lines: list[str]
+    seconds: float
+
+
+def run_mode(module: ModuleType, path: Path, mode_kwargs: dict[str, Any]) -> tuple[list[str], float]:
+    """
+    parses `path` afresh (in case a mode changes its input in place), with the day's caches cleared,
+    and times just the solving;
+    stderr (progress bars and such) is dropped
+    """
+    captured = io.StringIO()
+    clear_caches(module)
+    with contextlib.redirect_stdout(captured), contextlib.redirect_stderr(io.StringIO()), use_input(path):
+        input_parsed = module.get_parsed_input()
+        time_start = time.perf_counter()
+        module.main(input_parsed, **mode_kwargs)
+        seconds = time.perf_counter() - time_start
+    return _answer_lines(captured.getvalue(), mode_kwargs), seconds
+
+
+@dataclasses.dataclass
+class Verification:
+    day: int
+    path: Path
+    results: list[ModeResult]
+
+    @property
+    def reference(self) -> ModeResult:
+        return self.results[0]
+
+    def mismatched_modes(self) -> list[str]:
+        return [result.mode for result in self.results[1:] if result.answer_lines != self.reference.answer_lines]
+
+
+def verify_day(day: int, paths: list[Path]) -> list[Verification]:
+    module = import_day(day)
+    modes = day_modes(module)
+    mode_names = [REFERENCE_MODE] + [mode for mode in modes if mode != REFERENCE_MODE]
+    verifications = []
+    for path in paths:
+        results = [ModeResult(mode, *run_mode(module, path, modes[mode])) for mode in mode_names]
+        verifications.append(Verification(day, path, results))
+    return verifications
+
+
+def print_verification(verification: Verification):
+    reference_seconds = verification.reference.seconds
+    mismatched = set(verification.mismatched_modes())
+    input_name = f"{verification.path.parent.name}/{verification.path.name}"
+    for result in verification.results:
+        speedup = reference_seconds / result.seconds if result.seconds > 0 else float("inf")
+        status = "MISMATCH" if result.mode in mismatched else ("reference" if result is verification.reference else "ok")
+        print(
+            f"{verification.day:>3}  {input_name:<24}  {result.mode:<14}"
+            f"  {result.seconds:9.3f}  {speedup:7.2f}x  {status}"
+        )
+    for mode in sorted(mismatched):
+        result = next(r for r in verification.results if r.mode == mode)
+        print(f"  {REFERENCE_MODE}: {verification.reference.answer_lines}")
+        print(f"  {mode}: {result.answer_lines}")
+
+
+def main():
+    from argparse import ArgumentParser
+    arg_parser = ArgumentParser(description="check that each day's fast modes give the same answers as its reference mode")
+    arg_parser.add_argument("days", nargs="*", type=int, help="days to check (default: all with more than one mode)")
+    arg_parser.add_argument("-n", "--n-generated", type=int, default=5, help="generated inputs per day")
+    arg_parser.add_argument("--scale", type=float, default=0.1, help="size of generated inputs relative to the puzzle's")
+    arg_parser.add_argument("--seed", type=int, default=0, help="seed of the first generated input")
+    args = arg_parser.parse_args()
+    available_days = find_days()
+    if missing_days := sorted(set(args.days) - set(available_days)):
+        arg_parser.error(f"no module for day(s): {missing_days}")
+    days = args.days or [day for day in available_days if len(day_modes(import_day(day))) > 1]
+
+    n_mismatched = 0
+    print(f"{'day':>3}  {'input':<24}  {'mode':<14}  {'seconds':>9}  {'speedup':>8}  status")
+    with tempfile.TemporaryDirectory() as generated_dir:
+        for day in days:
+            paths = [input_path(day)] if input_path(day).exists() else []
+            if day in GENERATORS:
+                for seed in range(args.seed, args.seed + args.n_generated):
+                    seed_dir = Path(generated_dir) / f"seed{seed}"
+                    paths += write_inputs([day], seed_dir, scale=args.scale, seed=seed).values()
+            for verification in verify_day(day, paths):
+                print_verification(verification)
+                n_mismatched += len(verification.mismatched_modes())
+    if n_mismatched > 0:
+        print(f"{n_mismatched} mode(s) disagreed with {REFERENCE_MODE}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()